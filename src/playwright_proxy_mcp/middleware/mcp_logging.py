@@ -58,7 +58,7 @@ class MCPLoggingMiddleware(Middleware):
         tool_name = getattr(context.message, "name", "unknown")
         arguments = getattr(context.message, "arguments", {}) or {}
 
-        start_time = time.time()
+        start_time = time.monotonic()
 
         logger.info(f"CLIENT_MCP → Tool call: {tool_name}")
         if self.log_request_params:
@@ -66,7 +66,7 @@ class MCPLoggingMiddleware(Middleware):
 
         try:
             result = await call_next(context)
-            duration = (time.time() - start_time) * 1000  # ms
+            duration = (time.monotonic() - start_time) * 1000  # ms
 
             logger.info(f"CLIENT_MCP ← Tool result: {tool_name} ({duration:.2f}ms)")
             if self.log_response_data:
@@ -75,7 +75,7 @@ class MCPLoggingMiddleware(Middleware):
             return result
 
         except Exception as e:
-            duration = (time.time() - start_time) * 1000  # ms
+            duration = (time.monotonic() - start_time) * 1000  # ms
             logger.error(
                 f"CLIENT_MCP ✗ Tool error: {tool_name} ({duration:.2f}ms) - {type(e).__name__}: {e}"
             )
@@ -86,19 +86,19 @@ class MCPLoggingMiddleware(Middleware):
         # context.message is ReadResourceRequestParams (Pydantic model with uri)
         uri = str(getattr(context.message, "uri", "unknown"))
 
-        start_time = time.time()
+        start_time = time.monotonic()
 
         logger.info(f"CLIENT_MCP → Resource read: {uri}")
 
         try:
             result = await call_next(context)
-            duration = (time.time() - start_time) * 1000  # ms
+            duration = (time.monotonic() - start_time) * 1000  # ms
 
             logger.info(f"CLIENT_MCP ← Resource result: {uri} ({duration:.2f}ms)")
             return result
 
         except Exception as e:
-            duration = (time.time() - start_time) * 1000  # ms
+            duration = (time.monotonic() - start_time) * 1000  # ms
             logger.error(
                 f"CLIENT_MCP ✗ Resource error: {uri} ({duration:.2f}ms) - {type(e).__name__}: {e}"
             )
@@ -110,7 +110,7 @@ class MCPLoggingMiddleware(Middleware):
         name = getattr(context.message, "name", "unknown")
         arguments = getattr(context.message, "arguments", {}) or {}
 
-        start_time = time.time()
+        start_time = time.monotonic()
 
         logger.info(f"CLIENT_MCP → Prompt request: {name}")
         if self.log_request_params and arguments:
@@ -120,13 +120,13 @@ class MCPLoggingMiddleware(Middleware):
 
         try:
             result = await call_next(context)
-            duration = (time.time() - start_time) * 1000  # ms
+            duration = (time.monotonic() - start_time) * 1000  # ms
 
             logger.info(f"CLIENT_MCP ← Prompt result: {name} ({duration:.2f}ms)")
             return result
 
         except Exception as e:
-            duration = (time.time() - start_time) * 1000  # ms
+            duration = (time.monotonic() - start_time) * 1000  # ms
             logger.error(
                 f"CLIENT_MCP ✗ Prompt error: {name} ({duration:.2f}ms) - {type(e).__name__}: {e}"
             )
@@ -134,13 +134,13 @@ class MCPLoggingMiddleware(Middleware):
 
     async def on_list_tools(self, context: MiddlewareContext, call_next):
         """Log tool list requests from MCP clients"""
-        start_time = time.time()
+        start_time = time.monotonic()
 
         logger.info("CLIENT_MCP → List tools")
 
         try:
             result = await call_next(context)
-            duration = (time.time() - start_time) * 1000  # ms
+            duration = (time.monotonic() - start_time) * 1000  # ms
 
             # result is a Sequence[Tool], not a dict
             tool_count = len(result) if result else 0
@@ -148,7 +148,7 @@ class MCPLoggingMiddleware(Middleware):
             return result
 
         except Exception as e:
-            duration = (time.time() - start_time) * 1000  # ms
+            duration = (time.monotonic() - start_time) * 1000  # ms
             logger.error(
                 f"CLIENT_MCP ✗ List tools error: ({duration:.2f}ms) - {type(e).__name__}: {e}"
             )
@@ -156,13 +156,13 @@ class MCPLoggingMiddleware(Middleware):
 
     async def on_list_resources(self, context: MiddlewareContext, call_next):
         """Log resource list requests from MCP clients"""
-        start_time = time.time()
+        start_time = time.monotonic()
 
         logger.info("CLIENT_MCP → List resources")
 
         try:
             result = await call_next(context)
-            duration = (time.time() - start_time) * 1000  # ms
+            duration = (time.monotonic() - start_time) * 1000  # ms
 
             # result is a Sequence[Resource], not a dict
             resource_count = len(result) if result else 0
@@ -172,7 +172,7 @@ class MCPLoggingMiddleware(Middleware):
             return result
 
         except Exception as e:
-            duration = (time.time() - start_time) * 1000  # ms
+            duration = (time.monotonic() - start_time) * 1000  # ms
             logger.error(
                 f"CLIENT_MCP ✗ List resources error: ({duration:.2f}ms) - {type(e).__name__}: {e}"
             )
@@ -180,13 +180,13 @@ class MCPLoggingMiddleware(Middleware):
 
     async def on_list_prompts(self, context: MiddlewareContext, call_next):
         """Log prompt list requests from MCP clients"""
-        start_time = time.time()
+        start_time = time.monotonic()
 
         logger.info("CLIENT_MCP → List prompts")
 
         try:
             result = await call_next(context)
-            duration = (time.time() - start_time) * 1000  # ms
+            duration = (time.monotonic() - start_time) * 1000  # ms
 
             # result is a Sequence[Prompt], not a dict
             prompt_count = len(result) if result else 0
@@ -196,7 +196,7 @@ class MCPLoggingMiddleware(Middleware):
             return result
 
         except Exception as e:
-            duration = (time.time() - start_time) * 1000  # ms
+            duration = (time.monotonic() - start_time) * 1000  # ms
             logger.error(
                 f"CLIENT_MCP ✗ List prompts error: ({duration:.2f}ms) - {type(e).__name__}: {e}"
             )
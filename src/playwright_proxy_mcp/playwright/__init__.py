@@ -14,7 +14,9 @@ from .config import (
     PlaywrightConfig,
     PoolManagerConfig,
     load_blob_config,
+    load_navigation_cache_max_entries,
     load_pool_manager_config,
+    load_shutdown_timeout,
 )
 from .middleware import BinaryInterceptionMiddleware
 from .pool_manager import PoolManager
@@ -27,7 +29,9 @@ __all__ = [
     "PlaywrightConfig",
     "PoolManagerConfig",
     "load_blob_config",
+    "load_navigation_cache_max_entries",
     "load_pool_manager_config",
+    "load_shutdown_timeout",
     "BinaryInterceptionMiddleware",
     "PoolManager",
     "PlaywrightProcessManager",
@@ -19,6 +19,9 @@ from .config import BlobConfig
 
 logger = logging.getLogger(__name__)
 
+# data:mime/type;base64,<data>
+_DATA_URI_RE = re.compile(r"data:([^;]+);base64,(.+)")
+
 
 class PlaywrightBlobManager:
     """Manages blob storage for playwright binary data"""
@@ -74,7 +77,7 @@ class PlaywrightBlobManager:
             data_part = base64_data
 
             # Check for data URI format: data:mime/type;base64,<data>
-            data_uri_match = re.match(r"data:([^;]+);base64,(.+)", base64_data)
+            data_uri_match = _DATA_URI_RE.match(base64_data)
             if data_uri_match:
                 mime_type = data_uri_match.group(1)
                 data_part = data_uri_match.group(2)
@@ -139,6 +139,15 @@ def _get_int_env(key: str, default: int) -> int:
         return default
 
 
+def _get_positive_int_env(key: str, default: int) -> int:
+    """Get integer environment variable, falling back to the default below 1"""
+    value = _get_int_env(key, default)
+    if value < 1:
+        logger.warning(f"{key}={value} must be at least 1, using default {default}")
+        return default
+    return value
+
+
 # Configuration key mappings for _apply_config_overrides
 # Each tuple: (env_suffix, config_key, value_type)
 # value_type: "str", "bool", "int_action", "int_navigation"
@@ -591,6 +600,28 @@ def load_pool_manager_config() -> PoolManagerConfig:
 
 
 
+def load_shutdown_timeout() -> int:
+    """
+    Load the graceful shutdown deadline from the environment.
+
+    Returns:
+        Seconds to wait for all pools to stop (PW_MCP_PROXY_SHUTDOWN_TIMEOUT,
+        default 10; values below 1 fall back to the default)
+    """
+    return _get_positive_int_env("PW_MCP_PROXY_SHUTDOWN_TIMEOUT", 10)
+
+
+def load_navigation_cache_max_entries() -> int:
+    """
+    Load the navigation cache size limit from the environment.
+
+    Returns:
+        Maximum cached snapshots (PW_MCP_PROXY_NAVIGATION_CACHE_MAX_ENTRIES,
+        default 100; values below 1 fall back to the default)
+    """
+    return _get_positive_int_env("PW_MCP_PROXY_NAVIGATION_CACHE_MAX_ENTRIES", 100)
+
+
 def load_blob_config() -> BlobConfig:
     """
     Load blob storage configuration from environment variables.
@@ -13,6 +13,11 @@ from .blob_manager import PlaywrightBlobManager
 
 logger = logging.getLogger(__name__)
 
+# Patterns applied to response strings, compiled once at import
+_DATA_URI_RE = re.compile(r"data:([^;]+);base64,(.+)")
+_DATA_URI_MIME_RE = re.compile(r"data:([^;]+);base64,")
+_BASE64_RE = re.compile(r"^[A-Za-z0-9+/]+=*$")
+
 
 class BinaryInterceptionMiddleware:
     """
@@ -238,7 +243,7 @@ class BinaryInterceptionMiddleware:
             True if should be stored as blob
         """
         # Check for data URI pattern
-        data_uri_match = re.match(r"data:([^;]+);base64,(.+)", value)
+        data_uri_match = _DATA_URI_RE.match(value)
         if not data_uri_match:
             # Not a data URI, check if it's a large base64 string
             # (heuristic: long string with base64 characters)
@@ -246,7 +251,7 @@ class BinaryInterceptionMiddleware:
                 return False
 
             # Check if it looks like base64
-            if not re.match(r"^[A-Za-z0-9+/]+=*$", value):
+            if not _BASE64_RE.match(value):
                 return False
 
         # Estimate size
@@ -297,7 +302,7 @@ class BinaryInterceptionMiddleware:
             File extension (e.g., ".png")
         """
         # Check for data URI pattern
-        match = re.match(r"data:([^;]+);base64,", data)
+        match = _DATA_URI_MIME_RE.match(data)
         if not match:
             return ".bin"
 
@@ -9,15 +9,16 @@ Version 2.0.0
 
 import asyncio
 import logging
+import time
 from contextlib import asynccontextmanager
-from datetime import datetime, timezone
-from typing import TYPE_CHECKING, AsyncIterator
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, AsyncIterator, Callable
 
-from leasedkeyq import LeasedKeyQueue
+from leasedkeyq import Lease, LeasedKeyQueue
 
 from .config import InstanceConfig, PoolConfig, PoolManagerConfig
 from .process_manager import PlaywrightProcessManager
-from .proxy_client import PlaywrightProxyClient
+from .proxy_client import PlaywrightProxyClient, clear_tools_cache
 
 if TYPE_CHECKING:
     from .blob_manager import BlobManager  # type: ignore[attr-defined]
@@ -26,6 +27,26 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _ns_to_datetime(ns: int | None) -> datetime | None:
+    """Convert an epoch timestamp in nanoseconds to an aware UTC datetime"""
+    if ns is None:
+        return None
+    # Integer arithmetic truncates to microseconds instead of rounding a float
+    return _EPOCH + timedelta(microseconds=ns // 1000)
+
+
+def _datetime_to_ns(value: datetime | None) -> int | None:
+    """Convert a datetime to epoch nanoseconds (naive values are treated as UTC)"""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // timedelta(microseconds=1) * 1000
+
+
 class BrowserInstance:
     """Represents a single browser instance (subprocess + proxy client)"""
 
@@ -35,35 +56,63 @@ class BrowserInstance:
         alias: str | None,
         proxy_client: PlaywrightProxyClient,
         process_manager: PlaywrightProcessManager,
+        on_state_change: Callable[[], None] | None = None,
     ):
         self.instance_id = instance_id
         self.alias = alias
         self.proxy_client = proxy_client
         self.process_manager = process_manager
-        self.lease_started_at: datetime | None = None
-        self.last_health_check: datetime | None = None
+        # Wall-clock timestamps are kept as epoch nanoseconds and only turned
+        # into datetimes/ISO strings when status is actually reported.
+        self._lease_started_ns: int | None = None
+        self._last_health_check_ns: int | None = None
         self.health_check_error: str | None = None
+        self._on_state_change = on_state_change
+
+    def _notify_state_change(self) -> None:
+        """Let the owning pool know that reported status has changed"""
+        if self._on_state_change is not None:
+            self._on_state_change()
+
+    @property
+    def lease_started_at(self) -> datetime | None:
+        """Time the current lease started (UTC), or None if not leased"""
+        return _ns_to_datetime(self._lease_started_ns)
+
+    @lease_started_at.setter
+    def lease_started_at(self, value: datetime | None) -> None:
+        self._lease_started_ns = _datetime_to_ns(value)
+
+    @property
+    def last_health_check(self) -> datetime | None:
+        """Time of the most recent health check (UTC), or None if never checked"""
+        return _ns_to_datetime(self._last_health_check_ns)
+
+    @last_health_check.setter
+    def last_health_check(self, value: datetime | None) -> None:
+        self._last_health_check_ns = _datetime_to_ns(value)
 
     @property
     def is_leased(self) -> bool:
         """Check if instance is currently leased"""
-        return self.lease_started_at is not None
+        return self._lease_started_ns is not None
 
     @property
     def lease_duration_ms(self) -> int | None:
         """Get lease duration in milliseconds"""
-        if not self.lease_started_at:
+        if self._lease_started_ns is None:
             return None
-        delta = datetime.now(timezone.utc) - self.lease_started_at
-        return int(delta.total_seconds() * 1000)
+        return (time.time_ns() - self._lease_started_ns) // 1_000_000
 
     def mark_leased(self) -> None:
         """Mark instance as leased"""
-        self.lease_started_at = datetime.now(timezone.utc)
+        self._lease_started_ns = time.time_ns()
+        self._notify_state_change()
 
     def mark_released(self) -> None:
         """Mark instance as released"""
-        self.lease_started_at = None
+        self._lease_started_ns = None
+        self._notify_state_change()
 
     async def check_health(self) -> bool:
         """
@@ -72,7 +121,7 @@ class BrowserInstance:
         Returns:
             True if healthy, False otherwise
         """
-        self.last_health_check = datetime.now(timezone.utc)
+        self._last_health_check_ns = time.time_ns()
         try:
             is_healthy = await self.proxy_client.is_healthy()
             if is_healthy:
@@ -87,6 +136,8 @@ class BrowserInstance:
                 exc_info=True,
             )
             return False
+        finally:
+            self._notify_state_change()
 
     async def stop(self) -> None:
         """Stop the browser instance"""
@@ -105,8 +156,16 @@ class BrowserPool:
         self.description = config["description"]
         self.instances: dict[str, BrowserInstance] = {}
         self.lease_queue: LeasedKeyQueue[str, BrowserInstance] | None = None
+        self._instance_locks: dict[str, asyncio.Lock] = {}
+        self._key_index: dict[str, str] = {}
+        self._status_cache: dict | None = None
+        self._status_cache_dirty = True
         self._config = config
 
+    def _invalidate_status(self) -> None:
+        """Mark the cached status as stale (called on lease/health changes)"""
+        self._status_cache_dirty = True
+
     async def initialize(
         self, blob_manager: "BlobManager", middleware: "BinaryInterceptMiddleware"
     ) -> None:
@@ -119,20 +178,41 @@ class BrowserPool:
         """
         logger.info(f"Initializing pool '{self.name}' with {len(self._config['instance_configs'])} instances")
 
-        # Create all instances
-        for instance_cfg in self._config["instance_configs"]:
-            await self._create_instance(instance_cfg, blob_manager, middleware)
+        # Create all instances concurrently; each one spawns its own subprocess
+        # and runs its own MCP handshake, so nothing needs to be serialized
+        instance_configs = self._config["instance_configs"]
+        results = await asyncio.gather(
+            *(self._create_instance(cfg, blob_manager, middleware) for cfg in instance_configs),
+            return_exceptions=True,
+        )
 
-        # Create lease queue
-        self.lease_queue = LeasedKeyQueue[str, BrowserInstance]()
+        # Keep configuration order (FIFO order, status listings) regardless of
+        # which instance finished starting first
+        self.instances = {
+            cfg["instance_id"]: self.instances[cfg["instance_id"]]
+            for cfg in instance_configs
+            if cfg["instance_id"] in self.instances
+        }
 
-        # Populate queue with instances (by ID and alias)
+        # Instances that did start stay registered so stop() can clean them up
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        # Per-instance locks shard targeted (ID/alias) leases away from the FIFO
+        # queue, so waiting on a busy instance does not hold up other leases
+        self._instance_locks = {instance_id: asyncio.Lock() for instance_id in self.instances}
+
+        # Resolve both IDs and aliases to instance IDs
+        self._key_index = {instance_id: instance_id for instance_id in self.instances}
         for instance_id, instance in self.instances.items():
-            # Add by ID
-            await self.lease_queue.put(instance_id, instance)
-            # Add by alias if set
             if instance.alias:
-                await self.lease_queue.put(instance.alias, instance)
+                self._key_index[instance.alias] = instance_id
+
+        # Create lease queue (FIFO over instance IDs)
+        self.lease_queue = LeasedKeyQueue[str, BrowserInstance]()
+        for instance_id, instance in self.instances.items():
+            await self.lease_queue.put(instance_id, instance)
 
         logger.info(f"Pool '{self.name}' initialized successfully")
 
@@ -154,63 +234,94 @@ class BrowserPool:
         alias = instance_cfg["alias"]
         config = instance_cfg["config"]
 
-        logger.info("="*50)
-        logger.info(
-            f"Creating instance {instance_id} in pool '{self.name}'"
-            + (f" (alias: {alias})" if alias else "")
-        )
-        logger.debug(f"Instance config: browser={config.get('browser', 'N/A')}, "
-                    f"headless={config.get('headless', 'N/A')}, "
-                    f"wsl_windows={config.get('wsl_windows', False)}")
+        # Step timings (ms) are collected locally and emitted as a single
+        # structured record once the instance is up, instead of one record per step
+        steps: dict[str, float] = {}
+        started = time.perf_counter()
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Creating instance %s in pool '%s' (alias=%s, browser=%s, headless=%s, wsl_windows=%s)",
+                instance_id,
+                self.name,
+                alias,
+                config.get("browser", "N/A"),
+                config.get("headless", "N/A"),
+                config.get("wsl_windows", False),
+            )
 
         try:
-            # Create process manager
-            logger.debug(f"  [1/4] Creating PlaywrightProcessManager for instance {instance_id}")
+            # Create process manager and proxy client
             process_manager = PlaywrightProcessManager()
-
-            # Create proxy client
-            logger.debug(f"  [2/4] Creating PlaywrightProxyClient for instance {instance_id}")
             proxy_client = PlaywrightProxyClient(process_manager, middleware)
+            steps["construct_ms"] = (time.perf_counter() - started) * 1000
 
             # Start proxy client (spawns subprocess)
-            logger.info(f"  [3/4] Starting proxy client (spawning subprocess) for instance {instance_id}")
+            mark = time.perf_counter()
             await proxy_client.start(config)
-            logger.debug(f"  Proxy client started for instance {instance_id}")
+            steps["start_ms"] = (time.perf_counter() - mark) * 1000
 
             # Register process with process manager for monitoring
-            logger.debug(f"  [4/4] Registering process with process manager for instance {instance_id}")
+            mark = time.perf_counter()
             if proxy_client._client and hasattr(proxy_client._client, "_transport"):
                 transport = proxy_client._client._transport  # type: ignore[attr-defined]
                 if hasattr(transport, "_process"):
                     await process_manager.set_process(transport._process)
-                    logger.debug(f"  Process registered (PID: {transport._process.pid if hasattr(transport._process, 'pid') else 'unknown'})")
                 else:
-                    logger.warning(f"  Transport has no _process attribute for instance {instance_id}")
+                    logger.warning(f"Transport has no _process attribute for instance {instance_id}")
             else:
-                logger.warning(f"  Proxy client has no transport for instance {instance_id}")
+                logger.warning(f"Proxy client has no transport for instance {instance_id}")
+            steps["register_ms"] = (time.perf_counter() - mark) * 1000
 
             # Create instance wrapper
-            instance = BrowserInstance(instance_id, alias, proxy_client, process_manager)
+            instance = BrowserInstance(
+                instance_id,
+                alias,
+                proxy_client,
+                process_manager,
+                on_state_change=self._invalidate_status,
+            )
 
             # Store instance
             self.instances[instance_id] = instance
+            self._invalidate_status()
 
+            steps["total_ms"] = (time.perf_counter() - started) * 1000
             logger.info(
-                f"✓ Instance {instance_id} in pool '{self.name}' created successfully"
+                "Instance %s created in pool '%s'%s (%.0fms)",
+                instance_id,
+                self.name,
+                f" (alias: {alias})" if alias else "",
+                steps["total_ms"],
+                extra={
+                    "steps": steps,
+                    "browser": config.get("browser"),
+                    "headless": config.get("headless"),
+                },
             )
-            logger.info("="*50)
 
         except Exception as e:
-            logger.error("="*50)
             logger.error(
-                f"✗ Failed to create instance {instance_id} in pool '{self.name}': {e}",
+                f"Failed to create instance {instance_id} in pool '{self.name}': {e}",
                 exc_info=True,
+                extra={"steps": steps},
             )
-            logger.error("="*50)
             raise RuntimeError(
                 f"Pool '{self.name}' instance {instance_id} failed to start: {e}"
             ) from e
 
+    def resolve_instance_key(self, instance_key: str) -> str | None:
+        """
+        Resolve an instance ID or alias to its instance ID.
+
+        Args:
+            instance_key: Instance ID or alias
+
+        Returns:
+            Instance ID, or None if no instance matches
+        """
+        return self._key_index.get(instance_key)
+
     @asynccontextmanager
     async def lease_instance(
         self, instance_key: str | None = None
@@ -245,29 +356,24 @@ class BrowserPool:
             async with pool.lease_instance("main_browser") as (client, instance_id):
                 await client.call_tool(...)
         """
-        if not self.lease_queue:
+        lease_queue = self.lease_queue
+        if not lease_queue:
             raise ValueError(f"Pool '{self.name}' not initialized")
 
-        # Acquire lease from queue
+        # Acquire lease
         if instance_key:
-            # Validate instance key exists before attempting to lease
-            # Check both instance IDs and aliases
-            valid_keys = set(self.instances.keys())
-            for inst in self.instances.values():
-                if inst.alias:
-                    valid_keys.add(inst.alias)
-
-            if instance_key not in valid_keys:
+            instance_id = self.resolve_instance_key(instance_key)
+            if instance_id is None:
                 raise ValueError(
                     f"Pool '{self.name}': Instance '{instance_key}' not found "
                     f"(available IDs: {list(self.instances.keys())})"
                 )
 
             # Lease specific instance (blocks until available)
-            key, instance, lease = await self.lease_queue.take(instance_key)
+            instance, lease = await self._acquire_instance(lease_queue, instance_id)
         else:
             # Lease first available (FIFO)
-            key, instance, lease = await self.lease_queue.get()
+            instance, lease = await self._acquire_next(lease_queue)
 
         # Mark as leased
         instance.mark_leased()
@@ -285,16 +391,93 @@ class BrowserPool:
             instance.mark_released()
 
             # Return instance to queue for reuse
-            await self.lease_queue.release(lease)
+            if lease is not None:
+                await lease_queue.release(lease)
+            self._instance_locks[instance.instance_id].release()
 
             logger.debug(
                 f"Released instance {instance.instance_id} to pool '{self.name}'"
             )
 
+    async def _acquire_instance(
+        self, lease_queue: LeasedKeyQueue[str, BrowserInstance], instance_id: str
+    ) -> tuple[BrowserInstance, Lease | None]:
+        """
+        Acquire a specific instance via its per-instance lock.
+
+        The instance is also pulled out of the FIFO queue when it is sitting
+        there, so get() callers skip it while it is held. If a FIFO caller has
+        already dequeued it (and is waiting on the lock), no queue lease is taken.
+
+        Args:
+            lease_queue: The pool's FIFO lease queue
+            instance_id: Resolved instance ID
+
+        Returns:
+            Tuple of (instance, queue lease or None)
+        """
+        instance_lock = self._instance_locks[instance_id]
+        await instance_lock.acquire()
+        try:
+            _, instance, lease = await lease_queue.take(instance_id, timeout=0)
+        except asyncio.TimeoutError:
+            return self.instances[instance_id], None
+        except BaseException:
+            instance_lock.release()
+            raise
+        return instance, lease
+
+    async def _acquire_next(
+        self, lease_queue: LeasedKeyQueue[str, BrowserInstance]
+    ) -> tuple[BrowserInstance, Lease | None]:
+        """
+        Acquire the first available instance from the FIFO queue.
+
+        Args:
+            lease_queue: The pool's FIFO lease queue
+
+        Returns:
+            Tuple of (instance, queue lease)
+        """
+        _, instance, lease = await lease_queue.get()
+        try:
+            await self._instance_locks[instance.instance_id].acquire()
+        except BaseException:
+            await lease_queue.release(lease, requeue_front=True)
+            raise
+        return instance, lease
+
     async def get_status(self) -> dict:
         """
         Get pool status including instance health.
 
+        The status is cached between lease/health changes; only lease
+        durations are refreshed on each call.
+
+        Returns:
+            Dictionary with pool status information
+        """
+        if self._status_cache is None or self._status_cache_dirty:
+            self._status_cache = self._build_status()
+            self._status_cache_dirty = False
+
+        cached = self._status_cache
+
+        # Copy per-instance dicts so callers can't mutate the cache
+        instance_statuses = []
+        for instance_status in cached["instances"]:
+            instance_status = {**instance_status}
+            if instance_status["leased"]:
+                instance = self.instances[instance_status["id"]]
+                instance_status["lease_duration_ms"] = instance.lease_duration_ms
+            instance_statuses.append(instance_status)
+
+        return {**cached, "instances": instance_statuses}
+
+    def _build_status(self) -> dict:
+        """
+        Build pool status from current instance state.
+
         Returns:
             Dictionary with pool status information
         """
@@ -366,21 +549,35 @@ class BrowserPool:
             "instances": instance_statuses,
         }
 
+    @staticmethod
+    async def _safe_check(instance: BrowserInstance) -> bool:
+        """
+        Run an instance health check, converting a crash into an unhealthy result.
+
+        Args:
+            instance: Instance to check
+
+        Returns:
+            True if healthy, False otherwise (including when the check raised)
+        """
+        try:
+            return await instance.check_health()
+        except Exception as e:
+            logger.warning(f"Health check crashed on instance {instance.instance_id}: {e}")
+            instance.health_check_error = str(e)
+            return False
+
     async def check_all_health(self) -> None:
         """Check health of all instances (bypasses leasing)"""
         logger.debug(f"Running health checks for pool '{self.name}'")
 
-        # Check all instances concurrently
-        tasks = [instance.check_health() for instance in self.instances.values()]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Check all instances concurrently; _safe_check never raises
+        instances = list(self.instances.values())
+        results = await asyncio.gather(*(self._safe_check(instance) for instance in instances))
 
         # Log results
-        for instance, result in zip(self.instances.values(), results):
-            if isinstance(result, Exception):
-                logger.warning(
-                    f"Health check exception for instance {instance.instance_id}: {result}"
-                )
-            elif not result:
+        for instance, healthy in zip(instances, results):
+            if not healthy:
                 logger.warning(
                     f"Instance {instance.instance_id} is unhealthy: {instance.health_check_error}"
                 )
@@ -392,6 +589,7 @@ class BrowserPool:
         # Stop all instances concurrently
         tasks = [instance.stop() for instance in self.instances.values()]
         await asyncio.gather(*tasks, return_exceptions=True)
+        self._invalidate_status()
 
         logger.info(f"Pool '{self.name}' stopped")
 
@@ -419,11 +617,22 @@ class PoolManager:
             f"Initializing pool manager with {len(self.config['pools'])} pools"
         )
 
-        # Create and initialize all pools
+        # Register all pools up front so stop() also covers a partial startup,
+        # then initialize them concurrently
         for pool_config in self.config["pools"]:
-            pool = BrowserPool(pool_config)
-            await pool.initialize(self.blob_manager, self.middleware)
-            self.pools[pool_config["name"]] = pool
+            self.pools[pool_config["name"]] = BrowserPool(pool_config)
+
+        try:
+            results = await asyncio.gather(
+                *(pool.initialize(self.blob_manager, self.middleware) for pool in self.pools.values()),
+                return_exceptions=True,
+            )
+        finally:
+            # Tool listings are shared only within this startup wave
+            clear_tools_cache()
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
         logger.info(
             f"Pool manager initialized. Default pool: '{self.default_pool_name}'"
@@ -481,15 +690,13 @@ class PoolManager:
         pool = self.pools[pool_name]
 
         # If this is the default pool and it was requested implicitly,
-        # check that it has healthy instances
-        if not pool_name or pool_name == self.default_pool_name:
-            healthy_count = sum(
-                1
-                for instance in pool.instances.values()
-                if not instance.health_check_error
+        # check that it has healthy instances (stopping at the first one found)
+        if pool_name == self.default_pool_name:
+            has_healthy = any(
+                not instance.health_check_error for instance in pool.instances.values()
             )
 
-            if healthy_count == 0:
+            if not has_healthy:
                 raise ValueError(
                     f"Default pool '{pool.name}' has no healthy instances. "
                     f"Specify explicit pool or restart failed instances."
@@ -572,8 +779,14 @@ class PoolManager:
                 },
             }
 
-    async def stop(self) -> None:
-        """Stop all pools and cleanup"""
+    async def stop(self, timeout: float | None = None) -> None:
+        """
+        Stop all pools and cleanup.
+
+        Args:
+            timeout: Seconds to wait for the pools to stop; on expiry the
+                remaining stops are cancelled so shutdown cannot hang
+        """
         logger.info("Stopping pool manager")
 
         # Cancel health check task
@@ -586,6 +799,10 @@ class PoolManager:
 
         # Stop all pools concurrently
         tasks = [pool.stop() for pool in self.pools.values()]
-        await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"Pools did not stop within {timeout}s, abandoning remaining shutdown")
+            return
 
         logger.info("Pool manager stopped")
@@ -8,19 +8,64 @@ by StdioTransport, but this class provides logging and monitoring.
 
 import asyncio
 import logging
+import os
+import sys
 from asyncio.subprocess import Process
 
 logger = logging.getLogger(__name__)
 
+# Bytes requested per read when draining subprocess stdout/stderr
+_READ_CHUNK_SIZE = 65536
+
+# Longest unterminated line buffered before it is logged as is
+_MAX_PENDING_LINE_BYTES = 1024 * 1024
+
+
+def install_pidfd_child_watcher() -> bool:
+    """
+    Use pidfd-based child exit notification for subprocesses on Linux.
+
+    Before Python 3.12 asyncio defaults to ThreadedChildWatcher, which starts
+    a dedicated waitpid() thread per child. PidfdChildWatcher instead registers
+    each child's pidfd with the running event loop. Python 3.12+ already picks
+    pidfd by default, and other platforms or kernels older than 5.3 keep the
+    existing watcher.
+
+    Must be called from within the running event loop before the subprocess
+    is spawned. Safe to call repeatedly.
+
+    Returns:
+        True if a pidfd child watcher is active for the running loop
+    """
+    if sys.platform != "linux" or sys.version_info >= (3, 12) or not hasattr(os, "pidfd_open"):
+        return False
+
+    loop = asyncio.get_running_loop()
+    policy = asyncio.get_event_loop_policy()
+    watcher = policy.get_child_watcher()
+
+    if not isinstance(watcher, asyncio.PidfdChildWatcher):
+        # pidfd_open exists in the os module but needs kernel support (5.3+)
+        try:
+            os.close(os.pidfd_open(os.getpid()))
+        except OSError:
+            return False
+        watcher = asyncio.PidfdChildWatcher()
+        policy.set_child_watcher(watcher)
+        logger.debug("Installed PidfdChildWatcher for subprocess exit notification")
+
+    if not watcher.is_active():
+        watcher.attach_loop(loop)
+    return True
+
 
 class PlaywrightProcessManager:
     """Manages playwright-mcp subprocess logging and monitoring"""
 
     def __init__(self) -> None:
         self.process: Process | None = None
-        self._shutdown_event = asyncio.Event()
 
-    async def is_healthy(self) -> bool:
+    def is_healthy(self) -> bool:
         """
         Check if subprocess is running.
 
@@ -54,20 +99,15 @@ class PlaywrightProcessManager:
 
         logger.info("Stopping process monitoring...")
 
-        # Cancel stdout/stderr logging tasks
-        if hasattr(self, "_stdout_task") and self._stdout_task:
-            self._stdout_task.cancel()
-            try:
-                await self._stdout_task
-            except asyncio.CancelledError:
-                pass
-
-        if hasattr(self, "_stderr_task") and self._stderr_task:
-            self._stderr_task.cancel()
-            try:
-                await self._stderr_task
-            except asyncio.CancelledError:
-                pass
+        # Cancel both logging tasks up front, then wait for them together
+        tasks = [
+            task
+            for task in (getattr(self, "_stdout_task", None), getattr(self, "_stderr_task", None))
+            if task is not None
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
         self.process = None
         logger.info("Process monitoring stopped")
@@ -84,17 +124,8 @@ class PlaywrightProcessManager:
         logger.debug("Logging stdout from subprocess")
 
         try:
-            while True:
-                line = await self.process.stdout.readline()
-                if not line:
-                    logger.debug("No more stdout output from subprocess")
-                    break
-
-                # Decode and log stdout output
-                stdout_line = line.decode("utf-8", errors="replace").rstrip()
-                if stdout_line:
-                    logger.info(f"UPSTREAM_MCP [stdout] {stdout_line}")
-
+            await _pump_stream(self.process.stdout, "stdout", logging.INFO)
+            logger.debug("No more stdout output from subprocess")
         except asyncio.CancelledError:
             logger.debug("Stdout logger task cancelled")
             raise
@@ -113,19 +144,74 @@ class PlaywrightProcessManager:
         logger.debug("Logging stderr from subprocess")
 
         try:
-            while True:
-                line = await self.process.stderr.readline()
-                if not line:
-                    logger.debug("No more stderr output from subprocess")
-                    break
-
-                # Decode and log stderr output
-                stderr_line = line.decode("utf-8", errors="replace").rstrip()
-                if stderr_line:
-                    logger.warning(f"UPSTREAM_MCP [stderr] {stderr_line}")
-
+            await _pump_stream(self.process.stderr, "stderr", logging.WARNING)
+            logger.debug("No more stderr output from subprocess")
         except asyncio.CancelledError:
             logger.debug("Stderr logger task cancelled")
             raise
         except Exception as e:
             logger.error(f"Error in stderr logger: {e}")
+
+
+async def _pump_stream(stream: asyncio.StreamReader, label: str, level: int) -> None:
+    """
+    Log every line from a subprocess stream until EOF.
+
+    Reads in large chunks and splits lines in Python so bursts of output cost
+    one await and one log record per chunk rather than per line. Only complete
+    lines, or overlong ones cut at a UTF-8 character boundary, are decoded, so
+    multi-byte characters are never split across reads.
+
+    Args:
+        stream: Subprocess stdout or stderr reader
+        label: Stream name shown in the log prefix
+        level: Logging level for each batch
+    """
+    prefix = f"UPSTREAM_MCP [{label}] "
+    pending = bytearray()
+    while chunk := await stream.read(_READ_CHUNK_SIZE):
+        pending += chunk
+        end = pending.rfind(b"\n")
+        if end >= 0:
+            lines = bytes(pending[:end]).split(b"\n")
+            del pending[: end + 1]
+            if logger.isEnabledFor(level):
+                _log_upstream_lines(lines, prefix, level)
+
+        # Output with no newline (progress bars, minified dumps) is flushed in pieces
+        # rather than buffered without bound, keeping any partial character
+        if len(pending) >= _MAX_PENDING_LINE_BYTES:
+            end = _utf8_boundary(pending)
+            if logger.isEnabledFor(level):
+                _log_upstream_lines([bytes(pending[:end])], prefix, level)
+            del pending[:end]
+
+    # Flush a final line that was not newline-terminated
+    if pending and logger.isEnabledFor(level):
+        _log_upstream_lines([bytes(pending)], prefix, level)
+
+
+def _utf8_boundary(data: bytearray) -> int:
+    """Return the length of data up to the start of a trailing incomplete UTF-8 sequence"""
+    start = len(data) - 1
+    # A sequence is at most 4 bytes: a lead byte plus up to 3 continuation bytes
+    while start > len(data) - 4 and start > 0 and data[start] & 0xC0 == 0x80:
+        start -= 1
+    lead = data[start]
+    if lead >= 0xF0:
+        width = 4
+    elif lead >= 0xE0:
+        width = 3
+    elif lead >= 0xC0:
+        width = 2
+    else:
+        return len(data)
+    return start if start + width > len(data) else len(data)
+
+
+def _log_upstream_lines(raw_lines: list[bytes], prefix: str, level: int) -> None:
+    """Decode lines of subprocess output and log them as one record, skipping blanks"""
+    decoded = b"\n".join(raw_lines).decode("utf-8", errors="replace").split("\n")
+    text = "\n".join(prefix + line for line in map(str.rstrip, decoded) if line)
+    if text:
+        logger.log(level, "%s", text)
@@ -10,20 +10,203 @@ Uses FastMCP Client with StdioTransport for stdio-based communication.
 import asyncio
 import logging
 import os
+import shlex
 import shutil
 import subprocess
 import time
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 
 from fastmcp.client import Client
 from fastmcp.client.transports import StdioTransport
 
 from .config import PlaywrightConfig
 from .middleware import BinaryInterceptionMiddleware
-from .process_manager import PlaywrightProcessManager
+from .process_manager import PlaywrightProcessManager, install_pidfd_child_watcher
 
 logger = logging.getLogger(__name__)
 
+# playwright-mcp CLI arguments as (config key, flag, kind), grouped and ordered
+# as they appear on the command line. Kinds:
+#   "flag"   - append the flag when the value is truthy
+#   "value"  - append the flag and value when the value is truthy
+#   "always" - append the flag and value whenever the key is present
+#   "path"   - like "value", converting absolute paths for WSL->Windows mode
+_CliSpec = tuple[tuple[str, str, str], ...]
+
+_BROWSER_ARGS: _CliSpec = (
+    ("browser", "--browser", "always"),
+    ("headless", "--headless", "flag"),
+    ("no_sandbox", "--no-sandbox", "flag"),
+    ("device", "--device", "value"),
+    ("viewport_size", "--viewport-size", "value"),
+    ("isolated", "--isolated", "flag"),
+)
+_SESSION_ARGS: _CliSpec = (
+    ("user_data_dir", "--user-data-dir", "value"),
+    ("storage_state", "--storage-state", "value"),
+    ("save_session", "--save-session", "flag"),
+)
+_NETWORK_ARGS: _CliSpec = (
+    ("allowed_origins", "--allowed-origins", "value"),
+    ("blocked_origins", "--blocked-origins", "value"),
+    ("proxy_server", "--proxy-server", "value"),
+    ("caps", "--caps", "value"),
+)
+_RECORDING_ARGS: _CliSpec = (
+    ("save_trace", "--save-trace", "flag"),
+    ("save_video", "--save-video", "value"),
+    ("output_dir", "--output-dir", "always"),
+)
+_TIMEOUT_ARGS: _CliSpec = (
+    ("timeout_action", "--timeout-action", "always"),
+    ("timeout_navigation", "--timeout-navigation", "always"),
+    ("image_responses", "--image-responses", "always"),
+)
+_STEALTH_ARGS: _CliSpec = (
+    ("user_agent", "--user-agent", "value"),
+    ("init_script", "--init-script", "path"),
+    ("ignore_https_errors", "--ignore-https-errors", "flag"),
+)
+_EXTENSION_ARGS: _CliSpec = (
+    ("extension", "--extension", "flag"),
+    ("shared_browser_context", "--shared-browser-context", "flag"),
+)
+
+
+def _append_cli_args(
+    command: list[str],
+    config: Mapping[str, Any],
+    spec: _CliSpec,
+    path_converter: Callable[[str], str] | None = None,
+) -> None:
+    """
+    Append the CLI arguments described by a spec table.
+
+    Args:
+        command: Command list to append to (modified in place)
+        config: Playwright configuration
+        spec: (config key, flag, kind) entries to apply in order
+        path_converter: Optional converter for absolute "path" values
+    """
+    for key, flag, kind in spec:
+        if kind == "always":
+            if key in config:
+                command.extend((flag, str(config[key])))
+            continue
+
+        value = config.get(key)
+        if not value:
+            continue
+        if kind == "flag":
+            command.append(flag)
+            continue
+
+        value = str(value)
+        if kind == "path" and path_converter is not None and value.startswith("/"):
+            value = path_converter(value)
+        command.extend((flag, value))
+
+
+# Separator framing the startup command banner
+_BANNER = "=" * 80
+
+# Consecutive failed pings that open the health circuit, and how long it stays open
+_HEALTH_FAILURE_THRESHOLD = 3
+_HEALTH_COOLDOWN_SECONDS = 5.0
+
+# How long a health result is reused before probing again
+_HEALTHY_CACHE_TTL_SECONDS = 1.0
+_UNHEALTHY_CACHE_TTL_SECONDS = 0.5
+
+# Resolved executable paths, reused across start/restart cycles
+_executable_cache: dict[str, str] = {}
+
+# WSL -> Windows path conversions; wslpath output for a given path is stable
+_windows_path_cache: dict[str, str] = {}
+
+# Discovered tools keyed by upstream command, and listings still in flight.
+# Only shared within one startup wave; see clear_tools_cache().
+_tools_cache: dict[tuple[str, ...], dict[str, Any]] = {}
+_tools_discovery: dict[tuple[str, ...], asyncio.Future[dict[str, Any]]] = {}
+
+# Upstream package launched by npx, and its entry point inside a global install
+_PLAYWRIGHT_MCP_PACKAGE = "@playwright/mcp"
+_PLAYWRIGHT_MCP_CLI = "cli.js"
+
+# `npm root -g` output keyed by npm path (None when it could not be determined)
+_npm_root_cache: dict[str, str | None] = {}
+_NPM_ROOT_TIMEOUT_SECONDS = 10.0
+
+
+def clear_tools_cache() -> None:
+    """
+    Forget tool listings shared between clients started with the same command.
+
+    Called once a startup wave is over so later starts (restarts, a new pool
+    manager) list tools again and pick up upstream package updates.
+    """
+    _tools_cache.clear()
+    _tools_discovery.clear()
+
+
+def _locate_executable(name: str) -> str | None:
+    """
+    Resolve an executable on PATH, reusing the previous result while it still exists.
+
+    Args:
+        name: Executable name to look up (e.g. "npx")
+
+    Returns:
+        Absolute path to the executable, or None if not found
+    """
+    cached = _executable_cache.get(name)
+    if cached is not None and os.access(cached, os.X_OK):
+        return cached
+
+    resolved = shutil.which(name)
+    if resolved is None:
+        _executable_cache.pop(name, None)
+    else:
+        _executable_cache[name] = resolved
+    return resolved
+
+
+def _locate_global_playwright_cli() -> str | None:
+    """
+    Find the entry point of a globally installed @playwright/mcp.
+
+    `npm root -g` is run once per npm executable; only the cheap file check
+    is repeated on later calls, so a package installed later is still found.
+
+    Returns:
+        Absolute path to the package's cli.js, or None if it is not installed
+    """
+    npm_path = _locate_executable("npm")
+    if not npm_path:
+        return None
+
+    if npm_path not in _npm_root_cache:
+        try:
+            result = subprocess.run(
+                [npm_path, "root", "-g"],
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=_NPM_ROOT_TIMEOUT_SECONDS,
+            )
+            _npm_root_cache[npm_path] = result.stdout.strip() or None
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.debug("Could not determine global npm root: %s", e)
+            _npm_root_cache[npm_path] = None
+
+    npm_root = _npm_root_cache[npm_path]
+    if npm_root is None:
+        return None
+
+    cli_path = os.path.join(npm_root, _PLAYWRIGHT_MCP_PACKAGE, _PLAYWRIGHT_MCP_CLI)
+    return cli_path if os.path.isfile(cli_path) else None
+
 
 class PlaywrightProxyClient:
     """
@@ -51,6 +234,14 @@ class PlaywrightProxyClient:
         self._transport: StdioTransport | None = None
         self._started = False
         self._available_tools: dict[str, Any] = {}
+        # Upstream command, used to share discovered tools between clients
+        self._command_key: tuple[str, ...] | None = None
+        # Last health result as (monotonic expiry, healthy). An open circuit
+        # breaker is a cached False that lasts for the cooldown.
+        self._health_cache: tuple[float, bool] | None = None
+        self._health_failures = 0
+        # Concurrent is_healthy() callers share one in-flight ping
+        self._health_probe: asyncio.Task[bool] | None = None
 
     async def start(self, config: PlaywrightConfig) -> None:
         """
@@ -65,22 +256,26 @@ class PlaywrightProxyClient:
 
         logger.info("Starting playwright proxy client with stdio transport...")
 
-        # Build command and environment
-        command = self._build_command(config)
+        # Build command and environment. Locating a global install may run
+        # `npm root -g`, so keep it off the event loop other pools start on.
+        command = await asyncio.to_thread(self._build_command, config)
         env = self._build_env(config)
+        self._command_key = tuple(command)
 
-        logger.info("=" * 80)
-        logger.info("Playwright MCP command configuration:")
-        logger.info(f"  Command: {' '.join(command)}")
-        logger.info(f"  Working directory: {os.getcwd()}")
-        logger.info("=" * 80)
+        cwd = os.getcwd()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(_BANNER)
+            logger.info("Playwright MCP command configuration:")
+            logger.info("  Command: %s", shlex.join(command))
+            logger.info("  Working directory: %s", cwd)
+            logger.info(_BANNER)
 
         # Create stdio transport
         self._transport = StdioTransport(
             command=command[0],
             args=command[1:],
             env=env,
-            cwd=os.getcwd(),
+            cwd=cwd,
             keep_alive=True,
             log_file=None,  # We handle logging via process_manager
         )
@@ -89,6 +284,7 @@ class PlaywrightProxyClient:
         self._client = Client(transport=self._transport)
 
         # Start subprocess and connect
+        install_pidfd_child_watcher()
         await self._client.__aenter__()
 
         # Note: StdioTransport manages subprocess internally
@@ -99,8 +295,10 @@ class PlaywrightProxyClient:
         await self._discover_tools()
 
         self._started = True
+        self._health_cache = None
+        self._health_failures = 0
         logger.info("Playwright proxy client started successfully via stdio")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
     async def stop(self) -> None:
         """Stop the proxy client and stdio subprocess"""
@@ -114,10 +312,12 @@ class PlaywrightProxyClient:
 
         # Disconnect FastMCP client (automatically terminates subprocess)
         if self._client:
+            # Client.__aexit__ already bounds the disconnect (anyio.move_on_after(5));
+            # cancelling it from outside could interrupt the transport reaping the child
             try:
                 await self._client.__aexit__(None, None, None)
             except Exception as e:
-                logger.error(f"Error disconnecting client: {e}")
+                logger.error("Error disconnecting client: %s", e)
             finally:
                 self._client = None
                 self._transport = None
@@ -135,15 +335,54 @@ class PlaywrightProxyClient:
         if not self._started or not self._client:
             return False
 
-        # Use MCP ping to verify responsiveness (doesn't require browser)
+        # Reuse a recent result. While the circuit is open this reports
+        # unhealthy without probing a hung upstream again; the next probe
+        # after the cooldown decides recovery.
+        cache = self._health_cache
+        if cache is not None and time.monotonic() < cache[0]:
+            return cache[1]
+
+        # Join an in-flight probe rather than sending another ping. Shield it so
+        # a cancelled caller does not cancel the probe other callers await.
+        if self._health_probe is None:
+            self._health_probe = asyncio.create_task(self._probe_health())
+        return await asyncio.shield(self._health_probe)
+
+    async def _probe_health(self) -> bool:
+        """
+        Ping the upstream server once and update the health circuit state.
+
+        Returns:
+            True if the MCP ping succeeded within the timeout
+        """
         try:
-            await asyncio.wait_for(
-                self._client.ping(),
-                timeout=3.0
-            )
+            if not self._client:
+                return False
+
+            # Use MCP ping to verify responsiveness (doesn't require browser)
+            try:
+                await asyncio.wait_for(
+                    self._client.ping(),
+                    timeout=3.0
+                )
+            except Exception:
+                self._health_failures += 1
+                ttl = _UNHEALTHY_CACHE_TTL_SECONDS
+                if self._health_failures >= _HEALTH_FAILURE_THRESHOLD:
+                    ttl = _HEALTH_COOLDOWN_SECONDS
+                    logger.warning(
+                        "Health pings failed %d times in a row; pausing probes for %.0fs",
+                        self._health_failures,
+                        _HEALTH_COOLDOWN_SECONDS,
+                    )
+                self._health_cache = (time.monotonic() + ttl, False)
+                return False
+
+            self._health_failures = 0
+            self._health_cache = (time.monotonic() + _HEALTHY_CACHE_TTL_SECONDS, True)
             return True
-        except Exception:
-            return False
+        finally:
+            self._health_probe = None
 
     def _build_command(self, config: PlaywrightConfig) -> list[str]:
         """
@@ -158,17 +397,47 @@ class PlaywrightProxyClient:
         Raises:
             RuntimeError: If required executables are not found
         """
-        # Build base command (npx or cmd.exe)
-        command = self._build_base_command(config)
+        # Prefer launching a global install with node directly; npx adds
+        # package resolution (and a registry check for @latest) to every start
+        command = self._build_direct_command(config)
+        if command is None:
+            # Build base command (npx or cmd.exe)
+            command = self._build_base_command(config)
 
-        # Add playwright package
-        command.append("@playwright/mcp@latest")
+            # Add playwright package
+            command.append(f"{_PLAYWRIGHT_MCP_PACKAGE}@latest")
 
         # Add configuration arguments
         self._add_config_arguments(command, config)
 
         return command
 
+    def _build_direct_command(self, config: PlaywrightConfig) -> list[str] | None:
+        """
+        Build a node command for a globally installed @playwright/mcp.
+
+        Args:
+            config: Playwright configuration
+
+        Returns:
+            Command running the package's cli.js with node, or None if npx
+            should be used instead (WSL->Windows mode, no global install or
+            no node on PATH)
+        """
+        if config.get("wsl_windows", False):
+            return None
+
+        cli_path = _locate_global_playwright_cli()
+        if cli_path is None:
+            return None
+
+        node_path = _locate_executable("node")
+        if not node_path:
+            return None
+
+        logger.info("Using global %s at: %s", _PLAYWRIGHT_MCP_PACKAGE, cli_path)
+        return [node_path, cli_path]
+
     def _build_base_command(self, config: PlaywrightConfig) -> list[str]:
         """
         Build the base command (npx or cmd.exe with npx.cmd).
@@ -202,14 +471,14 @@ class PlaywrightProxyClient:
         logger.info("Standard mode (PW_MCP_PROXY_WSL_WINDOWS not set)")
         logger.info("Using npx from PATH")
 
-        npx_path = shutil.which("npx")
+        npx_path = _locate_executable("npx")
         if not npx_path:
             logger.error("npx not found in PATH")
             raise RuntimeError(
                 "npx not found in PATH. Please ensure Node.js is installed."
             )
 
-        logger.info(f"Found npx at: {npx_path}")
+        logger.info("Found npx at: %s", npx_path)
         return [npx_path]
 
     def _build_wsl_windows_command(self) -> list[str]:
@@ -225,7 +494,7 @@ class PlaywrightProxyClient:
         logger.info("WSL->Windows mode enabled (PW_MCP_PROXY_WSL_WINDOWS set)")
         logger.info("Using Windows npx.cmd via cmd.exe")
 
-        cmd_exe = shutil.which("cmd.exe")
+        cmd_exe = _locate_executable("cmd.exe")
         if not cmd_exe:
             logger.error("cmd.exe not found in PATH")
             raise RuntimeError(
@@ -234,7 +503,7 @@ class PlaywrightProxyClient:
             )
 
         command = [cmd_exe, "/c", "npx.cmd"]
-        logger.info(f"Using command: {command}")
+        logger.info("Using command: %s", command)
         return command
 
     def _wsl_to_windows_path(self, wsl_path: str) -> str:
@@ -250,6 +519,10 @@ class PlaywrightProxyClient:
         Raises:
             RuntimeError: If wslpath command fails
         """
+        cached = _windows_path_cache.get(wsl_path)
+        if cached is not None:
+            return cached
+
         try:
             result = subprocess.run(
                 ["wslpath", "-w", wsl_path],
@@ -258,10 +531,11 @@ class PlaywrightProxyClient:
                 check=True,
             )
             windows_path = result.stdout.strip()
-            logger.info(f"Converted WSL path '{wsl_path}' to Windows path '{windows_path}'")
+            logger.info("Converted WSL path '%s' to Windows path '%s'", wsl_path, windows_path)
+            _windows_path_cache[wsl_path] = windows_path
             return windows_path
         except subprocess.CalledProcessError as e:
-            logger.error(f"Failed to convert WSL path '{wsl_path}': {e.stderr}")
+            logger.error("Failed to convert WSL path '%s': %s", wsl_path, e.stderr)
             raise RuntimeError(f"Failed to convert WSL path to Windows path: {e.stderr}") from e
         except FileNotFoundError:
             logger.error("wslpath command not found")
@@ -300,96 +574,34 @@ class PlaywrightProxyClient:
 
     def _add_browser_args(self, command: list[str], config: PlaywrightConfig) -> None:
         """Add browser-related arguments."""
-        if "browser" in config:
-            command.extend(["--browser", config["browser"]])
-
-        if "headless" in config and config["headless"]:
-            command.append("--headless")
-
-        if "no_sandbox" in config and config["no_sandbox"]:
-            command.append("--no-sandbox")
-
-        if "device" in config and config["device"]:
-            command.extend(["--device", config["device"]])
-
-        if "viewport_size" in config and config["viewport_size"]:
-            command.extend(["--viewport-size", config["viewport_size"]])
-
-        if "isolated" in config and config["isolated"]:
-            command.append("--isolated")
+        _append_cli_args(command, config, _BROWSER_ARGS)
 
     def _add_session_args(self, command: list[str], config: PlaywrightConfig) -> None:
         """Add session and storage arguments."""
-        if "user_data_dir" in config and config["user_data_dir"]:
-            command.extend(["--user-data-dir", config["user_data_dir"]])
-
-        if "storage_state" in config and config["storage_state"]:
-            command.extend(["--storage-state", config["storage_state"]])
-
-        if "save_session" in config and config["save_session"]:
-            command.append("--save-session")
+        _append_cli_args(command, config, _SESSION_ARGS)
 
     def _add_network_args(self, command: list[str], config: PlaywrightConfig) -> None:
         """Add network filtering and proxy arguments."""
-        if "allowed_origins" in config and config["allowed_origins"]:
-            command.extend(["--allowed-origins", config["allowed_origins"]])
-
-        if "blocked_origins" in config and config["blocked_origins"]:
-            command.extend(["--blocked-origins", config["blocked_origins"]])
-
-        if "proxy_server" in config and config["proxy_server"]:
-            command.extend(["--proxy-server", config["proxy_server"]])
-
-        if "caps" in config and config["caps"]:
-            command.extend(["--caps", config["caps"]])
+        _append_cli_args(command, config, _NETWORK_ARGS)
 
     def _add_recording_args(self, command: list[str], config: PlaywrightConfig) -> None:
         """Add recording and output arguments."""
-        if "save_trace" in config and config["save_trace"]:
-            command.append("--save-trace")
-
-        if "save_video" in config and config["save_video"]:
-            command.extend(["--save-video", config["save_video"]])
-
-        if "output_dir" in config:
-            command.extend(["--output-dir", config["output_dir"]])
+        _append_cli_args(command, config, _RECORDING_ARGS)
 
     def _add_timeout_args(self, command: list[str], config: PlaywrightConfig) -> None:
         """Add timeout and response configuration arguments."""
-        if "timeout_action" in config:
-            command.extend(["--timeout-action", str(config["timeout_action"])])
-
-        if "timeout_navigation" in config:
-            command.extend(["--timeout-navigation", str(config["timeout_navigation"])])
-
-        if "image_responses" in config:
-            command.extend(["--image-responses", config["image_responses"]])
+        _append_cli_args(command, config, _TIMEOUT_ARGS)
 
     def _add_stealth_args(self, command: list[str], config: PlaywrightConfig) -> None:
         """Add stealth and security arguments."""
-        if "user_agent" in config and config["user_agent"]:
-            command.extend(["--user-agent", config["user_agent"]])
-
-        if "init_script" in config and config["init_script"]:
-            init_script_path = config["init_script"]
-
-            # Convert WSL path to Windows path if in WSL->Windows mode
-            use_windows_node = config.get("wsl_windows", False)
-            if use_windows_node and init_script_path.startswith("/"):
-                init_script_path = self._wsl_to_windows_path(init_script_path)
-
-            command.extend(["--init-script", init_script_path])
-
-        if "ignore_https_errors" in config and config["ignore_https_errors"]:
-            command.append("--ignore-https-errors")
+        # Convert WSL paths to Windows paths if in WSL->Windows mode
+        use_windows_node = config.get("wsl_windows", False)
+        path_converter = self._wsl_to_windows_path if use_windows_node else None
+        _append_cli_args(command, config, _STEALTH_ARGS, path_converter)
 
     def _add_extension_args(self, command: list[str], config: PlaywrightConfig) -> None:
         """Add extension support arguments."""
-        if "extension" in config and config["extension"]:
-            command.append("--extension")
-
-        if "shared_browser_context" in config and config["shared_browser_context"]:
-            command.append("--shared-browser-context")
+        _append_cli_args(command, config, _EXTENSION_ARGS)
 
     def _build_env(self, config: PlaywrightConfig) -> dict[str, str]:
         """
@@ -401,13 +613,16 @@ class PlaywrightProxyClient:
         Returns:
             Environment dictionary
         """
+        # The full environment must be passed explicitly: with env=None the MCP
+        # stdio client only forwards a small allow-list of variables.
         env = os.environ.copy()
 
         # Pass through extension token if configured
         # NOTE: PLAYWRIGHT_MCP_EXTENSION_TOKEN is passed to upstream playwright-mcp server
         # This is one of the limited cases where PLAYWRIGHT_* prefix is correct (not PW_MCP_PROXY_*)
-        if "extension_token" in config and config["extension_token"]:
-            env["PLAYWRIGHT_MCP_EXTENSION_TOKEN"] = config["extension_token"]
+        extension_token = config.get("extension_token")
+        if extension_token:
+            env["PLAYWRIGHT_MCP_EXTENSION_TOKEN"] = extension_token
             logger.info("Set PLAYWRIGHT_MCP_EXTENSION_TOKEN in subprocess environment (for upstream playwright-mcp)")
 
         return env
@@ -415,33 +630,75 @@ class PlaywrightProxyClient:
     async def _discover_tools(self) -> None:
         """
         Discover available tools from playwright-mcp.
+
+        Clients launched with the same command expose the same tools, so the
+        result is shared between them and only the first one lists tools. If
+        that shared listing fails, the waiting clients list over their own
+        sessions instead.
         """
         try:
             logger.info("UPSTREAM_MCP → Discovering tools...")
 
-            # List tools via FastMCP client
-            if self._client is None:
-                raise RuntimeError("Client not initialized")
-            tools = await self._client.list_tools()
-
-            # Convert to dictionary
-            self._available_tools = {}
-            for tool in tools:
-                self._available_tools[tool.name] = {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "inputSchema": tool.inputSchema,
-                }
-
-            logger.info(
-                f"UPSTREAM_MCP ← Discovered {len(self._available_tools)} tools: "
-                f"{', '.join(self._available_tools.keys())}"
-            )
+            key = self._command_key
+            if key is None:
+                self._available_tools = await self._list_tools()
+            elif key in _tools_cache:
+                self._available_tools = _tools_cache[key]
+            else:
+                # Concurrently starting clients share one in-flight listing
+                discovery = _tools_discovery.get(key)
+                owner = discovery is None or discovery.done()
+                if owner:
+                    discovery = asyncio.ensure_future(self._list_tools())
+                    _tools_discovery[key] = discovery
+                try:
+                    self._available_tools = await asyncio.shield(discovery)
+                except Exception as e:
+                    if owner:
+                        raise
+                    # The shared listing ran over another client's session
+                    logger.warning(
+                        "UPSTREAM_MCP ⚠ Shared tool discovery failed (%s), listing directly", e
+                    )
+                    self._available_tools = await self._list_tools()
+                finally:
+                    if _tools_discovery.get(key) is discovery and discovery.done():
+                        del _tools_discovery[key]
+                _tools_cache[key] = self._available_tools
+
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "UPSTREAM_MCP ← Discovered %d tools: %s",
+                    len(self._available_tools),
+                    ", ".join(self._available_tools),
+                )
 
         except Exception as e:
-            logger.error(f"UPSTREAM_MCP ✗ Tool discovery failed: {e}")
+            logger.error("UPSTREAM_MCP ✗ Tool discovery failed: %s", e)
             raise RuntimeError(f"Failed to discover tools: {e}") from e
 
+    async def _list_tools(self) -> dict[str, Any]:
+        """
+        List tools from the upstream server.
+
+        Returns:
+            Dictionary of tool name to tool definition
+        """
+        # List tools via FastMCP client
+        if self._client is None:
+            raise RuntimeError("Client not initialized")
+        tools = await self._client.list_tools()
+
+        # Convert to dictionary
+        return {
+            tool.name: {
+                "name": tool.name,
+                "description": tool.description,
+                "inputSchema": tool.inputSchema,
+            }
+            for tool in tools
+        }
+
     async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
         """
         Call a tool on the upstream playwright-mcp server.
@@ -459,19 +716,19 @@ class PlaywrightProxyClient:
         if not self._started or not self._client:
             raise RuntimeError("Proxy client not started")
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         # 90-second timeout for tool calls
         timeout_seconds = 90.0
         try:
-            logger.info(f"UPSTREAM_MCP → Calling tool: {tool_name}")
+            logger.info("UPSTREAM_MCP → Calling tool: %s", tool_name)
 
             # Call tool via FastMCP client with 90-second timeout
             result = await asyncio.wait_for(
                 self._client.call_tool(tool_name, arguments),
                 timeout=timeout_seconds
             )
-            logger.info(f"Raw tool result for {tool_name}: {result}")
+            logger.info("Raw tool result for %s: %s", tool_name, result)
 
             # Check for errors (FastMCP Client uses snake_case: is_error)
             if result.is_error:
@@ -490,35 +747,40 @@ class PlaywrightProxyClient:
             # Transform through middleware
             transformed_result = await self.transform_response(tool_name, result)
 
-            duration = (time.time() - start_time) * 1000  # ms
-            logger.info(f"UPSTREAM_MCP ← Tool result: {tool_name} ({duration:.2f}ms)")
+            duration = (time.perf_counter_ns() - start_ns) / 1_000_000  # ms
+            logger.info("UPSTREAM_MCP ← Tool result: %s (%.2fms)", tool_name, duration)
 
             return transformed_result
 
         except asyncio.TimeoutError as e:
-            duration = (time.time() - start_time) * 1000  # ms
+            duration = (time.perf_counter_ns() - start_ns) / 1_000_000  # ms
             logger.error(
-                f"UPSTREAM_MCP ✗ Tool call timeout: {tool_name} ({duration:.2f}ms) - "
-                f"Exceeded {timeout_seconds:.0f} second timeout"
+                "UPSTREAM_MCP ✗ Tool call timeout: %s (%.2fms) - Exceeded %.0f second timeout",
+                tool_name,
+                duration,
+                timeout_seconds,
             )
             raise RuntimeError(f"Tool call timeout after {timeout_seconds:.0f}s: {tool_name}") from e
 
         except Exception as e:
-            duration = (time.time() - start_time) * 1000  # ms
+            duration = (time.perf_counter_ns() - start_ns) / 1_000_000  # ms
             logger.error(
-                f"UPSTREAM_MCP ✗ Tool call failed: {tool_name} ({duration:.2f}ms) - "
-                f"{type(e).__name__}: {e}"
+                "UPSTREAM_MCP ✗ Tool call failed: %s (%.2fms) - %s: %s",
+                tool_name,
+                duration,
+                type(e).__name__,
+                e,
             )
             raise
 
-    def get_available_tools(self) -> dict[str, Any]:
+    def get_available_tools(self) -> Mapping[str, Any]:
         """
         Get the list of available tools.
 
         Returns:
-            Dictionary of tool name to tool definition
+            Read-only view of tool name to tool definition
         """
-        return self._available_tools.copy()
+        return MappingProxyType(self._available_tools)
 
     async def transform_response(self, tool_name: str, response: Any) -> Any:
         """
@@ -537,6 +799,6 @@ class PlaywrightProxyClient:
         try:
             return await self.middleware.intercept_response(tool_name, response)
         except Exception as e:
-            logger.error(f"Error transforming response for {tool_name}: {e}")
+            logger.error("Error transforming response for %s: %s", tool_name, e)
             # Return original response if transformation fails
             return response
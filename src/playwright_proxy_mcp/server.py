@@ -11,8 +11,11 @@ This server:
 4. Returns blob:// URIs for large binary data (retrieval delegated to MCP Resource Server)
 """
 
+import asyncio
+import re
 import sys
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
+from contextvars import ContextVar
 from typing import Any
 
 from fastmcp import FastMCP
@@ -23,8 +26,12 @@ from .playwright import (
     PlaywrightBlobManager,
     PoolManager,
     load_blob_config,
+    load_navigation_cache_max_entries,
     load_pool_manager_config,
+    load_shutdown_timeout,
 )
+from .types import NavigationResponse
+from .utils.aria_processor import FlattenedAriaTree
 from .utils.logging_config import get_logger, log_tool_result, setup_file_logging
 
 # Configure logging using centralized utility
@@ -70,7 +77,9 @@ async def lifespan_context(server):
         # Initialize navigation cache (global, shared across all pools)
         from .utils.navigation_cache import NavigationCache
 
-        navigation_cache = NavigationCache(default_ttl=300)
+        navigation_cache = NavigationCache(
+            default_ttl=300, max_entries=load_navigation_cache_max_entries()
+        )
 
         # Initialize pool manager
         pool_manager = PoolManager(pool_manager_config, blob_manager, middleware)
@@ -97,10 +106,9 @@ async def lifespan_context(server):
             if blob_manager:
                 await blob_manager.stop_cleanup_task()
 
-            # Stop pool manager (stops all instances)
+            # Stop pool manager (stops all instances concurrently, bounded by the deadline)
             if pool_manager:
-                for pool in pool_manager.pools.values():
-                    await pool.stop()
+                await pool_manager.stop(timeout=load_shutdown_timeout())
 
             logger.info("Playwright MCP Proxy shut down successfully")
 
@@ -305,16 +313,76 @@ async def _call_playwright_tool(
     if not pool_manager:
         raise RuntimeError("Pool manager not initialized")
 
-    # Get the appropriate pool
-    pool = pool_manager.get_pool(browser_pool)
-
     # Lease an instance from the pool (RAII pattern via context manager)
-    async with pool.lease_instance(browser_instance) as (proxy_client, instance_id):
+    async with _lease_instance(browser_pool, browser_instance) as (proxy_client, instance_id):
         # Call tool through the leased proxy client
         result = await proxy_client.call_tool(tool_name, arguments)
         return (result, instance_id)
 
 
+# Lease held by browser_execute_bulk for a batch pinned to one instance:
+# (pool, proxy client, instance ID)
+_bulk_lease: ContextVar[tuple[Any, Any, str] | None] = ContextVar("_bulk_lease", default=None)
+
+# Set by browser_execute_bulk while running a command whose response it will drop
+_bulk_result_discarded: ContextVar[bool] = ContextVar("_bulk_result_discarded", default=False)
+
+
+@asynccontextmanager
+async def _lease_instance(browser_pool: str | None, browser_instance: str | None):
+    """
+    Lease an instance, reusing the lease held by an enclosing bulk run.
+
+    A command inside browser_execute_bulk that targets the batch's instance
+    (by ID or alias, or any instance of its pool) runs on the already-leased
+    client. Leasing it again would wait on the lock the batch itself holds.
+
+    Yields:
+        Tuple of (PlaywrightProxyClient, instance_id)
+    """
+    pool = pool_manager.get_pool(browser_pool)
+
+    held = _bulk_lease.get()
+    if held is not None:
+        held_pool, proxy_client, instance_id = held
+        if pool is held_pool and (
+            browser_instance is None
+            or pool.resolve_instance_key(browser_instance) == instance_id
+        ):
+            yield (proxy_client, instance_id)
+            return
+
+    async with pool.lease_instance(browser_instance) as (proxy_client, instance_id):
+        yield (proxy_client, instance_id)
+
+
+@asynccontextmanager
+async def _hold_bulk_lease(browser_pool: str | None, browser_instance: str | None):
+    """Hold the pinned instance's lease for the duration of a browser_execute_bulk run"""
+    if not pool_manager or browser_instance is None:
+        # Unpinned batches lease per command via FIFO
+        yield
+        return
+
+    async with AsyncExitStack() as stack:
+        try:
+            pool = pool_manager.get_pool(browser_pool)
+            proxy_client, instance_id = await stack.enter_async_context(
+                pool.lease_instance(browser_instance)
+            )
+        except (ValueError, RuntimeError):
+            # Unknown pool/instance or no healthy instance: each command reports it
+            held = None
+        else:
+            held = (pool, proxy_client, instance_id)
+
+        token = _bulk_lease.set(held)
+        try:
+            yield
+        finally:
+            _bulk_lease.reset(token)
+
+
 def _add_browser_instance_to_result(result: Any, instance_id: str) -> dict[str, Any]:
     """
     Add browser_instance to a tool result.
@@ -346,22 +414,42 @@ def _create_navigation_error(
     output_format: str = "yaml",
 ) -> dict[str, Any]:
     """Create a navigation error response."""
-    from typing import cast
+    return {
+        "success": False,
+        "url": url,
+        "error": error,
+        "cache_key": cache_key,
+        "total_items": 0,
+        "offset": offset,
+        "limit": limit,
+        "has_more": False,
+        "snapshot": None,
+        "output_format": output_format,
+    }
 
-    from .types import NavigationResponse
 
-    return cast(dict[str, Any], NavigationResponse(
-        success=False,
-        url=url,
-        error=error,
-        cache_key=cache_key,
-        total_items=0,
-        offset=offset,
-        limit=limit,
-        has_more=False,
-        snapshot=None,
-        output_format=output_format,
-    ))
+def _create_discarded_snapshot_response(
+    url: str,
+    cache_key: str,
+    offset: int,
+    limit: int,
+    output_format: str,
+    instance_id: str,
+) -> dict[str, Any]:
+    """Create the minimal response for a snapshot browser_execute_bulk will not return."""
+    return {
+        "success": True,
+        "url": url,
+        "cache_key": cache_key,
+        "total_items": 0,
+        "offset": offset,
+        "limit": limit,
+        "has_more": False,
+        "snapshot": None,
+        "error": None,
+        "output_format": output_format.lower(),
+        "browser_instance": instance_id,
+    }
 
 
 def _validate_navigation_params(
@@ -410,14 +498,14 @@ def _paginate_result_data(
     Apply pagination to result data.
 
     Args:
-        result_data: Data to paginate (list or single item)
+        result_data: Data to paginate (list, lazily flattened tree, or single item)
         offset: Starting index
         limit: Maximum items
 
     Returns:
         Tuple of (paginated_data, total_items, has_more)
     """
-    if isinstance(result_data, list):
+    if isinstance(result_data, (list, FlattenedAriaTree)):
         total = len(result_data)
         paginated = result_data[offset : offset + limit]
         has_more = offset + limit < total
@@ -489,18 +577,60 @@ def _process_snapshot_data(
     Returns:
         Tuple of (processed_data, error_message)
     """
-    from .utils.aria_processor import apply_jmespath_query, flatten_aria_tree
+    from .utils.aria_processor import (
+        apply_jmespath_query,
+        query_flattened_aria_tree,
+    )
 
-    result_data = flatten_aria_tree(snapshot_json) if flatten else snapshot_json
+    if not jmespath_query:
+        # Pagination alone only needs the requested page materialized
+        return (FlattenedAriaTree(snapshot_json) if flatten else snapshot_json), None
 
-    if jmespath_query:
-        result_data, query_error = apply_jmespath_query(result_data, jmespath_query)
-        if query_error:
-            return None, query_error
+    if flatten:
+        # Flatten and query in one walk where the query allows it
+        result_data, query_error = query_flattened_aria_tree(snapshot_json, jmespath_query)
+    else:
+        result_data, query_error = apply_jmespath_query(snapshot_json, jmespath_query)
+    if query_error:
+        return None, query_error
 
     return result_data, None
 
 
+def _process_cached_snapshot(
+    entry: Any,
+    snapshot_json: Any,
+    flatten: bool,
+    jmespath_query: str | None,
+) -> tuple[Any, str | None]:
+    """
+    Process snapshot data, reusing the result memoized on its cache entry.
+
+    Follow-up page requests with the same cache_key, flatten and query go
+    straight to pagination instead of flattening and querying again.
+
+    Args:
+        entry: Navigation cache entry holding the snapshot, or None
+        snapshot_json: Raw snapshot data
+        flatten: Whether to flatten the ARIA tree
+        jmespath_query: Optional JMESPath query to apply
+
+    Returns:
+        Tuple of (processed_data, error_message)
+    """
+    if entry is None:
+        return _process_snapshot_data(snapshot_json, flatten, jmespath_query)
+
+    processed_key = (flatten, jmespath_query)
+    if processed_key in entry.processed:
+        return entry.processed[processed_key], None
+
+    result_data, process_error = _process_snapshot_data(snapshot_json, flatten, jmespath_query)
+    if process_error is None:
+        entry.store_processed(processed_key, result_data)
+    return result_data, process_error
+
+
 @mcp.tool()
 @log_tool_result(logger)
 async def browser_navigate(
@@ -674,7 +804,6 @@ async def browser_navigate(
         - browser_snapshot: Capture snapshot without navigation
         - browser_take_screenshot: Visual screenshot instead of ARIA tree
     """
-    from .types import NavigationResponse
     from .utils.aria_processor import format_output
 
     # Check if navigation_cache is initialized
@@ -694,17 +823,18 @@ async def browser_navigate(
     if silent_mode:
         try:
             _, instance_id = await _call_playwright_tool("browser_navigate", {"url": url}, browser_pool, browser_instance)
-            response = NavigationResponse(
-                success=True, url=url, cache_key="", total_items=0, offset=0, limit=limit,
-                has_more=False, snapshot=None, error=None, output_format=output_format,
-            )
-            response["browser_instance"] = instance_id  # type: ignore[typeddict-unknown-key]
-            return response
+            # Fixed shape: no snapshot, so build the response in one literal
+            return {
+                "success": True, "url": url, "cache_key": "", "total_items": 0, "offset": 0,
+                "limit": limit, "has_more": False, "snapshot": None, "error": None,
+                "output_format": output_format, "browser_instance": instance_id,
+            }
         except Exception as e:
             return _create_navigation_error(url, f"Navigation failed: {e}", 0, limit, "", output_format)
 
     # Get or fetch snapshot data
     snapshot_json = None
+    entry = None
     key = ""
     instance_id = ""
 
@@ -716,9 +846,8 @@ async def browser_navigate(
                 snapshot_json = entry.snapshot_json
                 key = cache_key
                 # For cached results, we still need to get an instance for the response
-                pool = pool_manager.get_pool(browser_pool) if pool_manager else None
-                if pool:
-                    async with pool.lease_instance(browser_instance) as (_, inst_id):
+                if pool_manager:
+                    async with _lease_instance(browser_pool, browser_instance) as (_, inst_id):
                         instance_id = inst_id
 
         # Fetch fresh if no cache or cache miss
@@ -729,12 +858,17 @@ async def browser_navigate(
             )
             if error:
                 return _create_navigation_error(url, error, offset, limit, "", output_format)
+            entry = navigation_cache.get(key)
 
     except Exception as e:
         return _create_navigation_error(url, f"Navigation failed: {e}", offset, limit, "", output_format)
 
-    # Process snapshot with flattening and query
-    result_data, process_error = _process_snapshot_data(snapshot_json, flatten, jmespath_query)
+    # Snapshot is cached above; skip processing a response bulk execution drops
+    if _bulk_result_discarded.get():
+        return _create_discarded_snapshot_response(url, key, offset, limit, output_format, instance_id)
+
+    # Process snapshot with flattening and query (memoized per cache entry)
+    result_data, process_error = _process_cached_snapshot(entry, snapshot_json, flatten, jmespath_query)
     if process_error:
         return _create_navigation_error(url, process_error, offset, limit, key, output_format)
 
@@ -776,6 +910,34 @@ async def browser_navigate_back(
 # =============================================================================
 
 
+def _validate_bulk_command(cmd: Any, idx: int) -> str | None:
+    """Return the validation error for one browser_execute_bulk command, or None"""
+    if not isinstance(cmd, dict):
+        return f"Command at index {idx} is not a dictionary"
+    if "tool" not in cmd:
+        return f"Command at index {idx} missing required 'tool' field"
+    if "args" not in cmd:
+        return f"Command at index {idx} missing required 'args' field"
+    parallel_group = cmd.get("parallel_group")
+    if parallel_group is not None and (
+        not isinstance(parallel_group, int) or isinstance(parallel_group, bool)
+    ):
+        return f"Command at index {idx} has non-integer 'parallel_group'"
+    return None
+
+
+def _bulk_validation_error(error: str, total_count: int) -> dict[str, Any]:
+    """Create a browser_execute_bulk response for a batch rejected before execution"""
+    return {
+        "success": False,
+        "executed_count": 0,
+        "total_count": total_count,
+        "results": [],
+        "errors": [error],
+        "stopped_at": None,
+    }
+
+
 @mcp.tool()
 @log_tool_result(logger)
 async def browser_execute_bulk(
@@ -809,6 +971,11 @@ async def browser_execute_bulk(
             - tool (str, required): Tool name (e.g., "browser_navigate")
             - args (dict, required): Tool arguments as key-value pairs
             - return_result (bool, optional): Include result in response (default: False)
+            - parallel_group (int, optional): Consecutive commands with the same value run
+              concurrently; results and errors keep command order. Only group commands that
+              do not change page state (e.g., browser_verify_*, browser_console_messages,
+              browser_network_requests). If any grouped command fails with stop_on_error=True,
+              stopped_at is the lowest failing index.
 
         stop_on_error: Stop execution on first error (default: True).
             If False, continues executing remaining commands and collects all errors.
@@ -821,8 +988,9 @@ async def browser_execute_bulk(
             All commands in the batch will use instances from this pool.
 
         browser_instance: Target a specific instance within the pool. Default: None (FIFO selection)
-            When specified, all commands use this exact instance, ensuring session affinity.
-            When None, an instance is selected via FIFO and used for the entire batch.
+            When specified, all commands use this exact instance, ensuring session affinity;
+            its lease is held for the whole batch.
+            When None, each command leases an instance via FIFO.
 
     Returns:
         BulkExecutionResponse with execution metadata and selective results.
@@ -862,7 +1030,7 @@ async def browser_execute_bulk(
             return_all_results=false
         )
 
-        # Form filling workflow with automatic instance affinity
+        # Form filling workflow pinned to one instance of a pool
         browser_execute_bulk(
             commands=[
                 {"tool": "browser_navigate", "args": {"url": "...", "silent_mode": true}},
@@ -871,7 +1039,8 @@ async def browser_execute_bulk(
                 {"tool": "browser_wait_for", "args": {"text": "Success"}},
                 {"tool": "browser_snapshot", "args": {"output_format": "json"}, "return_result": true}
             ],
-            browser_pool="ISOLATED"  # FIFO selects an instance, used for all commands
+            browser_pool="ISOLATED",
+            browser_instance="0"  # All commands share this instance's session
         )
 
     Error Handling:
@@ -882,145 +1051,94 @@ async def browser_execute_bulk(
 
     Performance Notes:
         - Use silent_mode=True on navigation to skip large ARIA snapshots
+        - Navigate/snapshot commands whose result is not returned still cache their
+          snapshot but skip querying and formatting it
         - Set return_result=True only on final/critical commands
         - Consider pagination for large result sets
         - Bulk execution with instance affinity is more efficient than separate tool calls
     """
     # Validate non-empty commands array
     if not commands:
-        return {
-            "success": False,
-            "executed_count": 0,
-            "total_count": 0,
-            "results": [],
-            "errors": ["commands array cannot be empty"],
-            "stopped_at": None,
-        }
+        return _bulk_validation_error("commands array cannot be empty", 0)
 
     # Validate each command structure
     for idx, cmd in enumerate(commands):
-        if not isinstance(cmd, dict):
-            return {
-                "success": False,
-                "executed_count": 0,
-                "total_count": len(commands),
-                "results": [],
-                "errors": [f"Command at index {idx} is not a dictionary"],
-                "stopped_at": None,
-            }
-        if "tool" not in cmd:
-            return {
-                "success": False,
-                "executed_count": 0,
-                "total_count": len(commands),
-                "results": [],
-                "errors": [f"Command at index {idx} missing required 'tool' field"],
-                "stopped_at": None,
-            }
-        if "args" not in cmd:
-            return {
-                "success": False,
-                "executed_count": 0,
-                "total_count": len(commands),
-                "results": [],
-                "errors": [f"Command at index {idx} missing required 'args' field"],
-                "stopped_at": None,
-            }
-
-    # Map tool names to their wrapper functions
-    # This ensures all custom logic (JMESPath, pagination, blob handling, etc.) is executed
-    # Note: We need to access .fn to get the actual function from FunctionTool wrappers
-    tool_registry = {
-        # Navigation tools
-        "browser_navigate": browser_navigate.fn,
-        "browser_navigate_back": browser_navigate_back.fn,
-        # Snapshot & interaction tools
-        "browser_snapshot": browser_snapshot.fn,
-        "browser_click": browser_click.fn,
-        "browser_drag": browser_drag.fn,
-        "browser_hover": browser_hover.fn,
-        "browser_select_option": browser_select_option.fn,
-        "browser_generate_locator": browser_generate_locator.fn,
-        # Form interaction tools
-        "browser_fill_form": browser_fill_form.fn,
-        # Screenshot & PDF tools
-        "browser_take_screenshot": browser_take_screenshot.fn,
-        "browser_pdf_save": browser_pdf_save.fn,
-        # Code execution tools
-        "browser_run_code": browser_run_code.fn,
-        "browser_evaluate": browser_evaluate.fn,
-        # Mouse tools
-        "browser_mouse_move_xy": browser_mouse_move_xy.fn,
-        "browser_mouse_click_xy": browser_mouse_click_xy.fn,
-        "browser_mouse_drag_xy": browser_mouse_drag_xy.fn,
-        # Keyboard tools
-        "browser_press_key": browser_press_key.fn,
-        "browser_type": browser_type.fn,
-        # Wait & timing tools
-        "browser_wait_for": browser_wait_for.fn,
-        # Verification/testing tools
-        "browser_verify_element_visible": browser_verify_element_visible.fn,
-        "browser_verify_text_visible": browser_verify_text_visible.fn,
-        "browser_verify_list_visible": browser_verify_list_visible.fn,
-        "browser_verify_value": browser_verify_value.fn,
-        # Network tools
-        "browser_network_requests": browser_network_requests.fn,
-        # Tab management tools
-        "browser_tabs": browser_tabs.fn,
-        # Console tools
-        "browser_console_messages": browser_console_messages.fn,
-        # Dialog tools
-        "browser_handle_dialog": browser_handle_dialog.fn,
-        # File upload tools
-        "browser_file_upload": browser_file_upload.fn,
-        # Tracing tools
-        "browser_start_tracing": browser_start_tracing.fn,
-        "browser_stop_tracing": browser_stop_tracing.fn,
-        # Installation tools
-        "browser_install": browser_install.fn,
-    }
-
-    # Execute commands sequentially
-    results: list[Any | None] = []
-    errors: list[str | None] = []
-    executed_count = 0
-    stopped_at: int | None = None
-
-    for idx, cmd in enumerate(commands):
+        error = _validate_bulk_command(cmd, idx)
+        if error is not None:
+            return _bulk_validation_error(error, len(commands))
+
+    # browser_pool/browser_instance injected for instance affinity (if not already specified)
+    injections: dict[str, str] = {}
+    if browser_pool is not None:
+        injections["browser_pool"] = browser_pool
+    if browser_instance is not None:
+        injections["browser_instance"] = browser_instance
+
+    async def run_command(cmd: dict[str, Any]) -> tuple[Any, str | None]:
+        """Run one command, returning (result, error) instead of raising"""
         tool_name = cmd["tool"]
-        args = cmd.get("args", {}).copy()  # Copy to avoid mutating original
-        return_result = cmd.get("return_result", False) or return_all_results
+        args = cmd["args"]
 
-        # Inject browser_pool/browser_instance for instance affinity (if not already specified)
-        if browser_pool is not None and "browser_pool" not in args:
-            args["browser_pool"] = browser_pool
-        if browser_instance is not None and "browser_instance" not in args:
-            args["browser_instance"] = browser_instance
+        # Merge into a new dict only when something is missing; the original is never mutated
+        missing = {key: value for key, value in injections.items() if key not in args}
+        if missing:
+            args = {**args, **missing}
 
+        # Tell navigate/snapshot when their response will be dropped
+        token = _bulk_result_discarded.set(not (cmd.get("return_result", False) or return_all_results))
         try:
             # Try to find wrapper function first
-            if tool_name in tool_registry:
+            tool = _TOOL_REGISTRY.get(tool_name)
+            if tool is not None:
                 # Call wrapper function (preserves JMESPath, pagination, blob handling, etc.)
-                result = await tool_registry[tool_name](**args)
-            else:
-                # Fallback to direct call for any tools not in registry
-                result = await _call_playwright_tool(
-                    tool_name, args,
-                    args.get("browser_pool"), args.get("browser_instance")
-                )
-
-            results.append(result if return_result else None)
-            errors.append(None)
-            executed_count += 1
+                return await tool.fn(**args), None
+            # Fallback to direct call for any tools not in registry
+            return await _call_playwright_tool(
+                tool_name, args,
+                args.get("browser_pool"), args.get("browser_instance")
+            ), None
         except Exception as e:
-            # Continue silently - store error, null result
-            results.append(None)
-            errors.append(str(e))
-            executed_count += 1
+            return None, str(e)
+        finally:
+            _bulk_result_discarded.reset(token)
 
-            if stop_on_error:
-                stopped_at = idx
+    # Execute commands in order; consecutive commands sharing a parallel_group run concurrently
+    results: list[Any | None] = []
+    errors: list[str | None] = []
+    executed_count = 0
+    success = True
+    stopped_at: int | None = None
+
+    # One lease covers every command that runs on the batch's instance
+    async with _hold_bulk_lease(browser_pool, browser_instance):
+        idx = 0
+        while idx < len(commands):
+            group = commands[idx].get("parallel_group")
+            end = idx + 1
+            if group is not None:
+                while end < len(commands) and commands[end].get("parallel_group") == group:
+                    end += 1
+
+            if end - idx == 1:
+                outcomes = [await run_command(commands[idx])]
+            else:
+                outcomes = await asyncio.gather(*(run_command(cmd) for cmd in commands[idx:end]))
+
+            # Record outcomes in command order
+            for offset, (result, error) in enumerate(outcomes):
+                cmd = commands[idx + offset]
+                return_result = cmd.get("return_result", False) or return_all_results
+                results.append(result if return_result and error is None else None)
+                errors.append(error)
+                executed_count += 1
+                if error is not None:
+                    success = False
+                    if stop_on_error and stopped_at is None:
+                        stopped_at = idx + offset
+
+            if stopped_at is not None:
                 break
+            idx = end
 
     # Fill remaining slots if stopped early
     if stopped_at is not None:
@@ -1029,7 +1147,7 @@ async def browser_execute_bulk(
         errors.extend([None] * remaining)
 
     return {
-        "success": all(err is None for err in errors),
+        "success": success,
         "executed_count": executed_count,
         "total_count": len(commands),
         "results": results,
@@ -1043,14 +1161,16 @@ async def browser_execute_bulk(
 # =============================================================================
 
 
+# blob:// URL embedded in markdown links or plain text
+_BLOB_URL_RE = re.compile(r'blob://[a-zA-Z0-9\-_.]+')
+
+
 def _extract_blob_id_from_response(result: Any) -> str | None:
     """
     Extract blob ID from MCP response.
 
     Handles both dict and Pydantic model responses.
     """
-    import re
-
     # Extract content field
     content = None
     if isinstance(result, dict):
@@ -1061,20 +1181,26 @@ def _extract_blob_id_from_response(result: Any) -> str | None:
     # Search for blob item in content list
     if content and isinstance(content, list):
         for item in content:
-            # Handle both dict and object (Pydantic model) items
-            item_type = item.get("type") if isinstance(item, dict) else getattr(item, "type", None)
-            if item_type == "blob":
-                blob_id = item.get("blob_id") if isinstance(item, dict) else getattr(item, "blob_id", None)
-                if blob_id:
-                    return blob_id
+            # Handle both dict and object (Pydantic model) items, checking the kind once
+            if isinstance(item, dict):
+                item_type, blob_id, text = item.get("type"), item.get("blob_id"), item.get("text")
+            else:
+                item_type = getattr(item, "type", None)
+                blob_id = getattr(item, "blob_id", None)
+                text = getattr(item, "text", None)
+
+            if item_type == "blob" and blob_id:
+                return blob_id
 
             # Also check text content for blob:// URLs
-            text = item.get("text") if isinstance(item, dict) else getattr(item, "text", None)
             if text and isinstance(text, str):
-                # Extract blob:// URL from markdown links or plain text
-                match = re.search(r'blob://[a-zA-Z0-9\-_.]+', text)
-                if match:
-                    return match.group(0)
+                # Extract blob:// URL from markdown links or plain text; a substring
+                # scan rejects most text, and no match can start before its first hit
+                start = text.find("blob://")
+                if start >= 0:
+                    match = _BLOB_URL_RE.search(text, start)
+                    if match:
+                        return match.group(0)
 
     # Fallback: if result is already a string, return it
     if isinstance(result, str):
@@ -1373,10 +1499,8 @@ async def browser_evaluate(
     key = ""
     instance_id = ""
 
-    # Access module-level variable as attribute (can be patched in tests)
-    import sys
-    current_module = sys.modules[__name__]
-    nav_cache = getattr(current_module, 'navigation_cache', None)
+    # Module global read at call time, so patching server.navigation_cache still applies
+    nav_cache = navigation_cache
 
     try:
         if cache_key and nav_cache is not None:
@@ -1387,9 +1511,8 @@ async def browser_evaluate(
                 key = cache_key
                 # For cached results, we still need to get an instance for the response
                 # Use the requested instance or get one via FIFO
-                pool = pool_manager.get_pool(browser_pool) if pool_manager else None
-                if pool:
-                    async with pool.lease_instance(browser_instance) as (_, inst_id):
+                if pool_manager:
+                    async with _lease_instance(browser_pool, browser_instance) as (_, inst_id):
                         instance_id = inst_id
 
         # Evaluate if not cached
@@ -1598,7 +1721,6 @@ async def browser_snapshot(
         result, instance_id = await _call_playwright_tool("browser_snapshot", {"filename": filename}, browser_pool, browser_instance)
         return _add_browser_instance_to_result(result, instance_id)
 
-    from .types import NavigationResponse
     from .utils.aria_processor import format_output
 
     # Check if navigation_cache is initialized
@@ -1618,17 +1740,18 @@ async def browser_snapshot(
     if silent_mode:
         try:
             _, instance_id = await _call_playwright_tool("browser_snapshot", {}, browser_pool, browser_instance)
-            response = NavigationResponse(
-                success=True, url="", cache_key="", total_items=0, offset=0, limit=limit,
-                has_more=False, snapshot=None, error=None, output_format=output_format,
-            )
-            response["browser_instance"] = instance_id  # type: ignore[typeddict-unknown-key]
-            return response
+            # Fixed shape: no snapshot, so build the response in one literal
+            return {
+                "success": True, "url": "", "cache_key": "", "total_items": 0, "offset": 0,
+                "limit": limit, "has_more": False, "snapshot": None, "error": None,
+                "output_format": output_format, "browser_instance": instance_id,
+            }
         except Exception as e:
             return _create_navigation_error("", f"Snapshot failed: {e}", 0, limit, "", output_format)
 
     # Get or fetch snapshot data
     snapshot_json = None
+    entry = None
     key = ""
     instance_id = ""
 
@@ -1640,9 +1763,8 @@ async def browser_snapshot(
                 snapshot_json = entry.snapshot_json
                 key = cache_key
                 # For cached results, we still need to get an instance for the response
-                pool = pool_manager.get_pool(browser_pool) if pool_manager else None
-                if pool:
-                    async with pool.lease_instance(browser_instance) as (_, inst_id):
+                if pool_manager:
+                    async with _lease_instance(browser_pool, browser_instance) as (_, inst_id):
                         instance_id = inst_id
 
         # Fetch fresh if no cache or cache miss
@@ -1653,12 +1775,17 @@ async def browser_snapshot(
             )
             if error:
                 return _create_navigation_error("", error, offset, limit, "", output_format)
+            entry = navigation_cache.get(key)
 
     except Exception as e:
         return _create_navigation_error("", f"Snapshot failed: {e}", offset, limit, "", output_format)
 
-    # Process snapshot with flattening and query
-    result_data, process_error = _process_snapshot_data(snapshot_json, flatten, jmespath_query)
+    # Snapshot is cached above; skip processing a response bulk execution drops
+    if _bulk_result_discarded.get():
+        return _create_discarded_snapshot_response("", key, offset, limit, output_format, instance_id)
+
+    # Process snapshot with flattening and query (memoized per cache entry)
+    result_data, process_error = _process_cached_snapshot(entry, snapshot_json, flatten, jmespath_query)
     if process_error:
         return _create_navigation_error("", process_error, offset, limit, key, output_format)
 
@@ -2490,6 +2617,64 @@ async def browser_pool_status(pool_name: str | None = None) -> dict[str, Any]:
     return await pool_manager.get_status(pool_name)
 
 
+# =============================================================================
+# BULK EXECUTION REGISTRY
+# =============================================================================
+
+# Map tool names to their wrapper tools for browser_execute_bulk
+# This ensures all custom logic (JMESPath, pagination, blob handling, etc.) is executed
+# Built once at import; .fn is looked up per call so the wrapped function stays patchable
+_TOOL_REGISTRY: dict[str, Any] = {
+    # Navigation tools
+    "browser_navigate": browser_navigate,
+    "browser_navigate_back": browser_navigate_back,
+    # Snapshot & interaction tools
+    "browser_snapshot": browser_snapshot,
+    "browser_click": browser_click,
+    "browser_drag": browser_drag,
+    "browser_hover": browser_hover,
+    "browser_select_option": browser_select_option,
+    "browser_generate_locator": browser_generate_locator,
+    # Form interaction tools
+    "browser_fill_form": browser_fill_form,
+    # Screenshot & PDF tools
+    "browser_take_screenshot": browser_take_screenshot,
+    "browser_pdf_save": browser_pdf_save,
+    # Code execution tools
+    "browser_run_code": browser_run_code,
+    "browser_evaluate": browser_evaluate,
+    # Mouse tools
+    "browser_mouse_move_xy": browser_mouse_move_xy,
+    "browser_mouse_click_xy": browser_mouse_click_xy,
+    "browser_mouse_drag_xy": browser_mouse_drag_xy,
+    # Keyboard tools
+    "browser_press_key": browser_press_key,
+    "browser_type": browser_type,
+    # Wait & timing tools
+    "browser_wait_for": browser_wait_for,
+    # Verification/testing tools
+    "browser_verify_element_visible": browser_verify_element_visible,
+    "browser_verify_text_visible": browser_verify_text_visible,
+    "browser_verify_list_visible": browser_verify_list_visible,
+    "browser_verify_value": browser_verify_value,
+    # Network tools
+    "browser_network_requests": browser_network_requests,
+    # Tab management tools
+    "browser_tabs": browser_tabs,
+    # Console tools
+    "browser_console_messages": browser_console_messages,
+    # Dialog tools
+    "browser_handle_dialog": browser_handle_dialog,
+    # File upload tools
+    "browser_file_upload": browser_file_upload,
+    # Tracing tools
+    "browser_start_tracing": browser_start_tracing,
+    "browser_stop_tracing": browser_stop_tracing,
+    # Installation tools
+    "browser_install": browser_install,
+}
+
+
 # =============================================================================
 # RESOURCES
 # =============================================================================
@@ -2513,9 +2698,18 @@ async def get_proxy_status() -> str:
 
 
 def main() -> None:
-    """Run the MCP proxy server"""
+    """Run the MCP proxy server (on uvloop when it is installed)"""
     logger.info("Initializing Playwright MCP Proxy Server...")
-    mcp.run()
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        mcp.run()
+        return
+
+    import anyio
+
+    logger.info("Using uvloop event loop")
+    anyio.run(mcp.run_async, backend_options={"use_uvloop": True})
 
 
 if __name__ == "__main__":
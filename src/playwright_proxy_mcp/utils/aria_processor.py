@@ -4,14 +4,40 @@ ARIA Snapshot Processor
 Processes ARIA snapshots: parsing, querying, and formatting.
 """
 
-from typing import Any
+import sys
+from collections.abc import Iterator, Sequence
+from typing import Any, overload
 
 import mistune
 import yaml
 
 from aria_snapshot_parser import AriaSnapshotParser, AriaSnapshotSerializer
 
-from .jmespath_extensions import search_with_custom_functions
+from .jmespath_extensions import (
+    compile_filter_condition,
+    compile_list_filter,
+    search_with_custom_functions,
+)
+
+# Snapshot data is plain JSON, so the safe dumper suffices; prefer the libyaml-backed one
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+class _InterningSerializer(AriaSnapshotSerializer):
+    """
+    Serializer sharing one string object per distinct role.
+
+    Large snapshots repeat a few dozen roles thousands of times. to_dict
+    recurses through self, so each node's role is interned as it is built.
+    """
+
+    def to_dict(self, node: Any) -> Any:
+        result = super().to_dict(node)
+        if isinstance(result, dict):
+            role = result.get('role')
+            if isinstance(role, str):
+                result['role'] = sys.intern(role)
+        return result
 
 
 def parse_aria_snapshot(yaml_text: str) -> tuple[Any, list[str]]:
@@ -42,7 +68,7 @@ def parse_aria_snapshot(yaml_text: str) -> tuple[Any, list[str]]:
                     error_messages.append(e.message)
             return None, error_messages
 
-        serializer = AriaSnapshotSerializer()
+        serializer = _InterningSerializer()
         json_data = serializer.to_dict(tree)
         return json_data, []
 
@@ -144,11 +170,40 @@ def apply_jmespath_query(data: Any, expression: str) -> tuple[Any, str | None]:
         return ([], f"Invalid JMESPath query: {e}")
 
 
+def _walk_aria_tree(
+    node: dict | list, depth: int = 0, parent_role: str | None = None
+) -> Iterator[tuple[dict, int, str | None]]:
+    """
+    Yield (node, depth, parent_role) for every ARIA node in depth-first order.
+
+    Uses an explicit stack, so deeply nested snapshots cannot hit the
+    recursion limit and no intermediate lists are built per subtree.
+    """
+    stack: list[tuple[Any, int, str | None]] = [(node, depth, parent_role)]
+    while stack:
+        item, item_depth, item_parent = stack.pop()
+        if isinstance(item, list):
+            stack.extend((child, item_depth, item_parent) for child in reversed(item))
+        elif isinstance(item, dict):
+            yield item, item_depth, item_parent
+            children = item.get('children')
+            if children:
+                stack.append((children, item_depth + 1, item.get('role')))
+
+
+def _flat_node(node: dict, depth: int, parent_role: str | None, index: int) -> dict:
+    """Copy a node without its children and add flattening metadata"""
+    flat = {key: value for key, value in node.items() if key != 'children'}
+    flat['_depth'] = depth
+    flat['_parent_role'] = parent_role
+    flat['_index'] = index
+    return flat
+
+
 def flatten_aria_tree(
     node: dict | list,
     depth: int = 0,
     parent_role: str | None = None,
-    index_counter: list[int] | None = None
 ) -> list[dict]:
     """
     Flatten ARIA tree to depth-first list of nodes.
@@ -158,9 +213,8 @@ def flatten_aria_tree(
 
     Args:
         node: ARIA tree (dict) or root array (list)
-        depth: Current nesting level (0 = root)
+        depth: Nesting level of the given node (0 = root)
         parent_role: Role of parent node (for context)
-        index_counter: Mutable list containing current index (internal use)
 
     Returns:
         Flat list of nodes with added metadata fields:
@@ -176,38 +230,125 @@ def flatten_aria_tree(
             {"role": "button", "_depth": 1, "_parent_role": "document", "_index": 1}
         ]
     """
-    if index_counter is None:
-        index_counter = [0]
+    return [
+        _flat_node(item, item_depth, item_parent, index)
+        for index, (item, item_depth, item_parent) in enumerate(
+            _walk_aria_tree(node, depth, parent_role)
+        )
+    ]
+
+
+class _FlatNodeView:
+    """Field lookups as on the node's flattened copy, without making the copy"""
+
+    __slots__ = ('node', 'depth', 'parent_role', 'index')
+
+    def __init__(self) -> None:
+        self.node: dict = {}
+        self.depth = 0
+        self.parent_role: str | None = None
+        self.index = 0
+
+    def get(self, key: str) -> Any:
+        if key == '_depth':
+            return self.depth
+        if key == '_parent_role':
+            return self.parent_role
+        if key == '_index':
+            return self.index
+        if key == 'children':
+            return None
+        return self.node.get(key)
+
+
+def query_flattened_aria_tree(node: dict | list, expression: str) -> tuple[Any, str | None]:
+    """
+    Flatten an ARIA tree and apply a JMESPath query to the flat list.
+
+    List filters ([?...]) are evaluated on each node during the walk, so
+    non-matching nodes are dropped immediately instead of first materializing
+    the whole flattened list. When the filter condition only reads fields,
+    nodes are tested in place and only matches are copied. Other expressions
+    run on the full list.
+
+    Args:
+        node: ARIA tree (dict) or root array (list)
+        expression: JMESPath expression
+
+    Returns:
+        Tuple of (result, error_message), as from apply_jmespath_query
+    """
+    try:
+        apply_filter = compile_list_filter(expression)
+    except Exception as e:
+        return ([], f"Invalid JMESPath query: {e}")
+
+    if apply_filter is None:
+        return apply_jmespath_query(flatten_aria_tree(node), expression)
+
+    condition = compile_filter_condition(expression)
+    view = _FlatNodeView()
+    result: list = []
+    try:
+        for index, (item, depth, parent_role) in enumerate(_walk_aria_tree(node)):
+            if condition is not None:
+                view.node, view.depth, view.parent_role, view.index = item, depth, parent_role, index
+                if not condition(view):
+                    continue
+            result.extend(apply_filter(_flat_node(item, depth, parent_role, index)))
+    except Exception as e:
+        return ([], f"Invalid JMESPath query: {e}")
+    return (result, None)
+
+
+class FlattenedAriaTree(Sequence[dict]):
+    """
+    Lazily flattened ARIA tree.
+
+    Records each node's position in one walk and builds the flattened dicts
+    (as returned by flatten_aria_tree) only when they are accessed, so
+    paginating a large snapshot copies just the requested page.
+    """
 
-    result = []
+    __slots__ = ('_nodes', '_depths', '_parent_roles')
 
-    if isinstance(node, list):
-        # Process array of nodes
-        for item in node:
-            result.extend(flatten_aria_tree(item, depth, parent_role, index_counter))
+    def __init__(self, node: dict | list) -> None:
+        """
+        Walk the tree and record node positions.
 
-    elif isinstance(node, dict):
-        # Create copy of current node without children
-        node_copy = {**node}
+        Args:
+            node: ARIA tree (dict) or root array (list)
+        """
+        self._nodes: list[dict] = []
+        self._depths: list[int] = []
+        self._parent_roles: list[str | None] = []
+        for item, depth, parent_role in _walk_aria_tree(node):
+            self._nodes.append(item)
+            self._depths.append(depth)
+            self._parent_roles.append(parent_role)
 
-        # Extract children before adding metadata
-        children = node_copy.pop('children', None)
+    def __len__(self) -> int:
+        return len(self._nodes)
 
-        # Add metadata
-        node_copy['_depth'] = depth
-        node_copy['_parent_role'] = parent_role
-        node_copy['_index'] = index_counter[0]
-        index_counter[0] += 1
+    @overload
+    def __getitem__(self, index: int) -> dict: ...
 
-        # Add current node to result
-        result.append(node_copy)
+    @overload
+    def __getitem__(self, index: slice) -> list[dict]: ...
 
-        # Recursively flatten children
-        if children:
-            current_role = node.get('role')
-            result.extend(flatten_aria_tree(children, depth + 1, current_role, index_counter))
+    def __getitem__(self, index: int | slice) -> dict | list[dict]:
+        if isinstance(index, slice):
+            return [self._build(i) for i in range(*index.indices(len(self._nodes)))]
+        if index < 0:
+            index += len(self._nodes)
+        if not 0 <= index < len(self._nodes):
+            raise IndexError("FlattenedAriaTree index out of range")
+        return self._build(index)
 
-    return result
+    def _build(self, index: int) -> dict:
+        return _flat_node(
+            self._nodes[index], self._depths[index], self._parent_roles[index], index
+        )
 
 
 def format_output(
@@ -226,4 +367,4 @@ def format_output(
     if output_format.lower() == "json":
         return data
     else:  # yaml (default)
-        return yaml.dump(data, default_flow_style=False, allow_unicode=True)
+        return yaml.dump(data, Dumper=_YAML_DUMPER, default_flow_style=False, allow_unicode=True)
@@ -5,11 +5,15 @@ Extends JMESPath with custom functions for enhanced querying capabilities.
 Based on partsbox_mcp reference implementation.
 """
 
+import functools
 import re
+from collections.abc import Callable
 from typing import Any
 
 import jmespath
 from jmespath import functions
+from jmespath.parser import ParsedResult
+from jmespath.visitor import TreeInterpreter
 
 
 class CustomFunctions(functions.Functions):
@@ -99,6 +103,25 @@ class CustomFunctions(functions.Functions):
 _custom_options = jmespath.Options(custom_functions=CustomFunctions())
 
 
+# AST nodes that read fields of the filtered element but never the element itself
+_FIELD_CONDITION_NODES = frozenset({
+    "comparator",
+    "and_expression",
+    "or_expression",
+    "not_expression",
+    "function_expression",
+    "subexpression",
+    "field",
+    "literal",
+})
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_expression(expression: str) -> ParsedResult:
+    """Parse a JMESPath expression once; repeated queries reuse the AST"""
+    return jmespath.compile(expression)
+
+
 def search_with_custom_functions(expression: str, data: Any) -> Any:
     """
     Search data using JMESPath expression with custom functions.
@@ -110,4 +133,68 @@ def search_with_custom_functions(expression: str, data: Any) -> Any:
     Returns:
         Query result
     """
-    return jmespath.search(expression, data, options=_custom_options)
+    return _compile_expression(expression).search(data, options=_custom_options)
+
+
+def compile_list_filter(expression: str) -> Callable[[Any], list] | None:
+    """
+    Compile a bare list filter such as [?role == 'button'] or [?...].name.
+
+    A filter projection over the current list evaluates each element on its
+    own, so the returned function can be applied item by item and its results
+    concatenated to get the same answer as searching the whole list.
+
+    Args:
+        expression: JMESPath expression
+
+    Returns:
+        Function mapping one item to its (possibly empty) list of results,
+        or None if the expression is not a list filter
+    """
+    parsed = _compile_expression(expression)
+    ast = parsed.parsed
+    if ast["type"] != "filter_projection" or ast["children"][0]["type"] != "identity":
+        return None
+
+    def apply(item: Any) -> list:
+        return parsed.search([item], options=_custom_options)
+
+    return apply
+
+
+def _reads_fields_only(node: dict) -> bool:
+    """Check an AST only combines element fields, literals and functions of those"""
+    return node["type"] in _FIELD_CONDITION_NODES and all(
+        _reads_fields_only(child) for child in node["children"]
+    )
+
+
+def compile_filter_condition(expression: str) -> Callable[[Any], bool] | None:
+    """
+    Compile the condition of a list filter for testing elements without copying them.
+
+    Conditions such as role == 'button' or _depth < `3` only look up fields,
+    so the element can be any object with a dict-like get method.
+
+    Args:
+        expression: JMESPath expression
+
+    Returns:
+        Function reporting whether one element passes the filter, or None if
+        the expression is not a list filter or its condition uses the element
+        itself (e.g. @ or keys(@))
+    """
+    if compile_list_filter(expression) is None:
+        return None
+    condition = _compile_expression(expression).parsed["children"][2]
+    if not _reads_fields_only(condition):
+        return None
+
+    interpreter = TreeInterpreter(_custom_options)
+
+    def test(item: Any) -> bool:
+        value = interpreter.visit(condition, item)
+        # JMESPath truthiness: 0 is true, empty strings/lists/objects are false
+        return not (value == "" or value == [] or value == {} or value is None or value is False)
+
+    return test
@@ -6,11 +6,35 @@ The MCP protocol uses stdout for JSON-RPC communication, so all logging must
 go exclusively to files.
 """
 
+import atexit
 import functools
 import json
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
-from typing import Any, Callable, TypeVar
+from typing import Any, Callable, Mapping, TypeVar
+
+# Background thread that writes queued records to the log file
+_queue_listener: logging.handlers.QueueListener | None = None
+
+
+def _shutdown_listener(listener: logging.handlers.QueueListener) -> None:
+    """Flush a listener's queued records, stop its thread and close its handlers"""
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def _stop_queue_listener() -> None:
+    """Flush queued records to the log file and stop the writer thread"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _shutdown_listener(_queue_listener)
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
 
 
 def setup_file_logging(
@@ -25,6 +49,9 @@ def setup_file_logging(
     for MCP protocol communication with the client (FastMCP uses stdio transport).
     Logging to stdout would corrupt the MCP protocol messages.
 
+    Records are handed to a QueueHandler and written by a QueueListener thread,
+    so file I/O never blocks the event loop. Queued records are flushed at exit.
+
     Args:
         log_file: Path to the log file (relative or absolute)
         level: Logging level (default: logging.INFO)
@@ -33,6 +60,8 @@ def setup_file_logging(
     Returns:
         The root logger instance
     """
+    global _queue_listener
+
     # Ensure log directory exists
     log_path = Path(log_file)
 
@@ -52,16 +81,32 @@ def setup_file_logging(
     if format_string is None:
         format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
+    # Write to the file from a background thread; callers only enqueue
+    previous_listener = _queue_listener
+    file_handler = logging.FileHandler(log_path)
+    file_handler.setFormatter(logging.Formatter(format_string))
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # Message-only formatter so the record is not formatted twice (basicConfig
+    # would otherwise apply format_string here as well as on the file handler)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+
     # Configure root logger
     logging.basicConfig(
         level=level,
-        format=format_string,
-        handlers=[
-            logging.FileHandler(log_path),
-        ],
+        handlers=[queue_handler],
         force=True,  # Override any existing configuration
     )
 
+    # Retire the previous writer only after the root logger stopped feeding it
+    if previous_listener is not None:
+        _shutdown_listener(previous_listener)
+
     logger = logging.getLogger()
     logger.info(f"Logging configured: file={log_path}, level={logging.getLevelName(level)}")
 
@@ -81,24 +126,35 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+# Substrings that mark a key's value as sensitive in log_dict output
+_SENSITIVE_KEY_PARTS = ("token", "password", "secret", "key")
+
+
 def log_dict(
-    logger: logging.Logger, message: str, data: dict[str, Any], level: int = logging.INFO
+    logger: logging.Logger, message: str, data: Mapping[str, Any], level: int = logging.INFO
 ) -> None:
     """
     Log a dictionary with formatted key-value pairs.
 
+    Does nothing when the logger is not enabled for the level, so callers can
+    pass any mapping directly without copying or guarding it.
+
     Args:
         logger: Logger instance
         message: Prefix message
-        data: Dictionary to log
+        data: Mapping to log
         level: Log level (default: INFO)
     """
+    if not logger.isEnabledFor(level):
+        return
+
     logger.log(level, message)
     for key, value in data.items():
         # Mask sensitive values
-        if any(sensitive in key.lower() for sensitive in ["token", "password", "secret", "key"]):
+        lowered = key.lower()
+        if any(sensitive in lowered for sensitive in _SENSITIVE_KEY_PARTS):
             value = "***REDACTED***"
-        logger.log(level, f"  {key}: {value}")
+        logger.log(level, "  %s: %s", key, value)
 
 
 # Type variable for the decorator
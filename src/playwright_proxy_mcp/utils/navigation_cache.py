@@ -6,10 +6,14 @@ Based on partsbox_mcp PaginationCache pattern.
 """
 
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from time import time
 from typing import Any
 
+# Processed views (flatten/query variants) kept per entry
+_MAX_PROCESSED_VIEWS = 8
+
 
 @dataclass
 class CacheEntry:
@@ -20,6 +24,8 @@ class CacheEntry:
     created_at: float = field(default_factory=time)
     last_accessed: float = field(default_factory=time)
     ttl: int = 300  # 5 minutes default
+    # Processed snapshot data keyed by (flatten, jmespath_query)
+    processed: dict[tuple[bool, str | None], Any] = field(default_factory=dict)
 
     @property
     def is_expired(self) -> bool:
@@ -30,19 +36,33 @@ class CacheEntry:
         """Update last access time."""
         self.last_accessed = time()
 
+    def store_processed(self, key: tuple[bool, str | None], data: Any) -> None:
+        """Memoize processed snapshot data, evicting the oldest view when full."""
+        if key not in self.processed and len(self.processed) >= _MAX_PROCESSED_VIEWS:
+            del self.processed[next(iter(self.processed))]
+        self.processed[key] = data
+
 
 class NavigationCache:
     """Manages cached navigation snapshots for pagination."""
 
-    def __init__(self, default_ttl: int = 300):
+    def __init__(self, default_ttl: int = 300, max_entries: int = 100):
         """
         Initialize navigation cache.
 
         Args:
             default_ttl: Default time-to-live in seconds (default: 300 = 5 minutes)
+            max_entries: Maximum cached snapshots; least recently used are evicted first
+
+        Raises:
+            ValueError: If max_entries is less than 1
         """
-        self._cache: dict[str, CacheEntry] = {}
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        # Ordered least to most recently used
+        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
         self._default_ttl = default_ttl
+        self._max_entries = max_entries
 
     def create(self, url: str, snapshot_json: Any, ttl: int | None = None) -> str:
         """
@@ -55,6 +75,11 @@ class NavigationCache:
 
         Returns:
             Cache key for future retrieval
+
+        Note:
+            Keys are random per snapshot rather than derived from the URL: a
+            page's snapshot changes between visits, so two navigations to the
+            same (or an equivalent) URL must not share an entry.
         """
         self._lazy_cleanup()
         key = f"nav_{uuid.uuid4().hex[:8]}"
@@ -62,6 +87,8 @@ class NavigationCache:
         self._cache[key] = CacheEntry(
             url=url, snapshot_json=snapshot_json, ttl=entry_ttl
         )
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
         return key
 
     def get(self, key: str) -> CacheEntry | None:
@@ -85,6 +112,7 @@ class NavigationCache:
             return None
 
         entry.touch()
+        self._cache.move_to_end(key)
         return entry
 
     def delete(self, key: str) -> bool:
@@ -6,11 +6,13 @@ from typing import Any
 import pytest
 
 from playwright_proxy_mcp.utils.aria_processor import (
+    FlattenedAriaTree,
     _extract_yaml_from_markdown,
     apply_jmespath_query,
     flatten_aria_tree,
     format_output,
     parse_aria_snapshot,
+    query_flattened_aria_tree,
 )
 
 def test_extract_yaml_with_header():
@@ -405,6 +407,43 @@ def test_flatten_aria_tree_text_nodes():
     assert result[1]["_parent_role"] == "paragraph"
 
 
+def test_flatten_aria_tree_very_deep_tree():
+    """Test flattening a tree deeper than the recursion limit."""
+    tree: dict[str, Any] = {"role": "leaf"}
+    for _ in range(5000):
+        tree = {"role": "group", "children": [tree]}
+
+    result = flatten_aria_tree([tree])
+
+    assert len(result) == 5001
+    assert result[-1]["role"] == "leaf"
+    assert result[-1]["_depth"] == 5000
+
+
+def test_flattened_aria_tree_matches_eager_flatten():
+    """Test the lazy view yields the same nodes as flatten_aria_tree."""
+    tree = [
+        {
+            "role": "document",
+            "children": [
+                {"role": "banner", "children": [{"role": "link", "ref": "e1"}]},
+                {"role": "button", "name": {"value": "Submit"}},
+            ]
+        },
+        {"role": "contentinfo"},
+    ]
+
+    view = FlattenedAriaTree(tree)
+
+    assert len(view) == 5
+    assert list(view) == flatten_aria_tree(tree)
+    assert view[1:3] == flatten_aria_tree(tree)[1:3]
+    assert view[-1]["_index"] == 4
+    assert view[10:20] == []
+    with pytest.raises(IndexError):
+        view[5]
+
+
 def test_parse_aria_snapshot_invalid_yaml():
     """Test parsing invalid YAML content."""
     invalid_yaml = "not: valid: yaml: content: multiple: colons"
@@ -455,3 +494,83 @@ def test_format_output_case_insensitive():
     result_lower = format_output(data, "json")
 
     assert result_upper == result_lower == data
+
+
+def test_format_output_yaml_matches_pure_python_dumper():
+    """Test the libyaml-backed dumper produces the same YAML as the pure-Python one."""
+    import yaml
+
+    data = [
+        {"role": "link", "name": "Café – “quoted”", "props": {"url": "https://example.com/a b"}},
+        {"role": "text", "name": "multi\nline", "level": 2, "checked": True, "value": None},
+    ]
+
+    expected = yaml.dump(data, Dumper=yaml.SafeDumper, default_flow_style=False, allow_unicode=True)
+    assert format_output(data, "yaml") == expected
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "[?role == 'button']",
+        "[?_depth > `0`].name",
+        "[?contains(nvl(name, ''), 'Sub')]",
+        "[?role == 'button'] | [0]",
+        "length(@)",
+        "[?_depth < `2` && role == 'button'].name",
+        "[?!children]",
+        "[?_parent_role == 'group' || _index == `0`]",
+        "[?@.role == 'group']",
+    ],
+)
+def test_query_flattened_aria_tree_matches_flatten_then_query(expression):
+    """Test the single-walk query returns what flattening then querying returns."""
+    tree = [
+        {
+            "role": "document",
+            "children": [
+                {"role": "button", "name": "Submit", "ref": "e1"},
+                {"role": "group", "children": [{"role": "button", "name": "Cancel"}]},
+            ],
+        }
+    ]
+
+    assert query_flattened_aria_tree(tree, expression) == apply_jmespath_query(
+        flatten_aria_tree(tree), expression
+    )
+
+
+def test_query_flattened_aria_tree_invalid_query():
+    """Test invalid expressions report the same error as apply_jmespath_query."""
+    result, error = query_flattened_aria_tree([{"role": "button"}], "[?role ==")
+
+    assert result == []
+    assert error == apply_jmespath_query([], "[?role ==")[1]
+
+
+def test_query_flattened_aria_tree_copies_only_matching_nodes():
+    """Test field-only filters are tested in place and copy just the matches."""
+    from unittest.mock import patch
+
+    from playwright_proxy_mcp.utils import aria_processor
+
+    tree = [{"role": "list", "children": [{"role": "listitem", "name": str(i)} for i in range(50)]}]
+
+    with patch.object(aria_processor, "_flat_node", wraps=aria_processor._flat_node) as flat_node:
+        result, error = query_flattened_aria_tree(tree, "[?name == '7']")
+
+    assert error is None
+    assert [node["name"] for node in result] == ["7"]
+    assert flat_node.call_count == 1
+
+
+def test_parse_aria_snapshot_interns_roles():
+    """Test repeated roles share a single string object."""
+    yaml_text = "- list:\n" + "".join(f'  - listitem "item {i}" [ref=e{i}]\n' for i in range(20))
+
+    json_data, errors = parse_aria_snapshot(yaml_text)
+
+    assert errors == []
+    items = json_data[0]["children"]
+    assert len(items) == 20
+    assert all(item["role"] is items[0]["role"] for item in items)
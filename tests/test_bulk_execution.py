@@ -1,5 +1,7 @@
 """Tests for browser_execute_bulk tool."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, patch
 
@@ -303,3 +305,193 @@ async def test_bulk_execution_no_return_results():
         assert result["success"] is True
         assert result["executed_count"] == 3
         assert result["results"] == [None, None, None]
+
+
+@pytest.mark.asyncio
+async def test_bulk_execution_parallel_group_runs_concurrently():
+    """Test consecutive commands sharing a parallel_group overlap but keep result order."""
+    in_flight = 0
+    peak = 0
+
+    async def verify(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {"verified": kwargs["text"]}
+
+    with patch("playwright_proxy_mcp.server.browser_navigate.fn", new_callable=AsyncMock) as mock_nav, \
+         patch("playwright_proxy_mcp.server.browser_verify_text_visible.fn", side_effect=verify):
+        mock_nav.return_value = {"status": "navigated"}
+
+        result = await browser_execute_bulk(
+            commands=[
+                {"tool": "browser_navigate", "args": {"url": "https://example.com"}},
+                {"tool": "browser_verify_text_visible", "args": {"text": "a"}, "parallel_group": 1},
+                {"tool": "browser_verify_text_visible", "args": {"text": "b"}, "parallel_group": 1},
+                {"tool": "browser_verify_text_visible", "args": {"text": "c"}, "parallel_group": 1},
+            ],
+            return_all_results=True,
+        )
+
+    assert peak == 3
+    assert result["success"] is True
+    assert result["executed_count"] == 4
+    assert result["results"][1:] == [{"verified": "a"}, {"verified": "b"}, {"verified": "c"}]
+
+
+@pytest.mark.asyncio
+async def test_bulk_execution_parallel_group_stops_at_lowest_failure():
+    """Test a failing group reports the lowest failing index and skips later commands."""
+
+    async def verify(**kwargs):
+        if kwargs["text"] in ("b", "c"):
+            raise RuntimeError(f"missing {kwargs['text']}")
+        return {"verified": kwargs["text"]}
+
+    with patch("playwright_proxy_mcp.server.browser_verify_text_visible.fn", side_effect=verify), \
+         patch("playwright_proxy_mcp.server.browser_snapshot.fn", new_callable=AsyncMock) as mock_snap:
+        result = await browser_execute_bulk(
+            commands=[
+                {"tool": "browser_verify_text_visible", "args": {"text": "a"}, "parallel_group": 7},
+                {"tool": "browser_verify_text_visible", "args": {"text": "b"}, "parallel_group": 7},
+                {"tool": "browser_verify_text_visible", "args": {"text": "c"}, "parallel_group": 7},
+                {"tool": "browser_snapshot", "args": {}},
+            ],
+        )
+
+    mock_snap.assert_not_awaited()
+    assert result["success"] is False
+    assert result["stopped_at"] == 1
+    assert result["executed_count"] == 3
+    assert result["errors"] == [None, "missing b", "missing c", None]
+
+
+@pytest.mark.asyncio
+async def test_bulk_execution_rejects_non_integer_parallel_group():
+    """Test parallel_group must be an integer."""
+    result = await browser_execute_bulk(
+        commands=[{"tool": "browser_tabs", "args": {}, "parallel_group": "a"}]
+    )
+
+    assert result["success"] is False
+    assert result["errors"] == ["Command at index 0 has non-integer 'parallel_group'"]
+
+
+async def _single_instance_pool(proxy_client):
+    """Initialize a real one-instance BrowserPool with alias 'main' around a mock client."""
+    from unittest.mock import Mock
+
+    from playwright_proxy_mcp.playwright.config import InstanceConfig, PoolConfig
+    from playwright_proxy_mcp.playwright.pool_manager import BrowserInstance, BrowserPool
+
+    pool = BrowserPool(
+        PoolConfig(
+            name="SOLO",
+            instances=1,
+            is_default=True,
+            description="",
+            base_config={},
+            instance_configs=[InstanceConfig(instance_id="0", alias="main", config={})],
+        )
+    )
+    instance = Mock(spec=BrowserInstance)
+    instance.instance_id = "0"
+    instance.alias = "main"
+    instance.proxy_client = proxy_client
+
+    async def create_instance(cfg, blob_manager, middleware):
+        pool.instances["0"] = instance
+
+    with patch.object(pool, "_create_instance", new=create_instance):
+        await pool.initialize(Mock(), Mock())
+    return pool, instance
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch_instance", ["0", "main"])
+async def test_bulk_execution_holds_single_lease(mock_proxy_client, batch_instance):
+    """Test a pinned batch leases once and commands naming the instance by ID or alias reuse it."""
+    from unittest.mock import Mock
+
+    pool, instance = await _single_instance_pool(mock_proxy_client)
+    mock_pm = Mock()
+    mock_pm.get_pool = Mock(return_value=pool)
+    mock_proxy_client.call_tool = AsyncMock(return_value={"status": "ok"})
+
+    with patch("playwright_proxy_mcp.server.pool_manager", mock_pm):
+        result = await asyncio.wait_for(
+            browser_execute_bulk(
+                commands=[
+                    {"tool": "browser_press_key", "args": {"key": "Tab"}},
+                    {"tool": "browser_press_key", "args": {"key": "Enter"}, "parallel_group": 1},
+                    {"tool": "browser_wait_for", "args": {"time": 1}, "parallel_group": 1},
+                    {"tool": "browser_press_key", "args": {"key": "Escape", "browser_instance": "0"}},
+                    {"tool": "browser_press_key", "args": {"key": "Home", "browser_instance": "main"}},
+                ],
+                browser_instance=batch_instance,
+                return_all_results=True,
+            ),
+            timeout=1.0,
+        )
+
+    assert result["success"] is True
+    assert instance.mark_leased.call_count == 1
+    assert mock_proxy_client.call_tool.await_count == 5
+    assert all(r["browser_instance"] == "0" for r in result["results"])
+
+
+@pytest.mark.asyncio
+async def test_bulk_execution_unpinned_leases_per_command(mock_proxy_client):
+    """Test a batch without browser_instance leases per command, so naming an alias cannot deadlock."""
+    from unittest.mock import Mock
+
+    pool, instance = await _single_instance_pool(mock_proxy_client)
+    mock_pm = Mock()
+    mock_pm.get_pool = Mock(return_value=pool)
+    mock_proxy_client.call_tool = AsyncMock(return_value={"status": "ok"})
+
+    with patch("playwright_proxy_mcp.server.pool_manager", mock_pm):
+        result = await asyncio.wait_for(
+            browser_execute_bulk(
+                commands=[
+                    {"tool": "browser_press_key", "args": {"key": "Tab"}},
+                    {"tool": "browser_press_key", "args": {"key": "Enter", "browser_instance": "main"}},
+                ],
+            ),
+            timeout=1.0,
+        )
+
+    assert result["success"] is True
+    assert instance.mark_leased.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_bulk_execution_skips_formatting_unreturned_snapshots(mock_pool_manager, mock_proxy_client):
+    """Test dropped navigate/snapshot results are cached but not formatted."""
+    from playwright_proxy_mcp.utils.navigation_cache import NavigationCache
+
+    cache = NavigationCache()
+    mock_proxy_client.call_tool = AsyncMock(
+        return_value={"content": [{"type": "text", "text": '- button "Submit" [ref=e1]'}]}
+    )
+
+    with patch("playwright_proxy_mcp.server.pool_manager", mock_pool_manager), \
+         patch("playwright_proxy_mcp.server.navigation_cache", cache), \
+         patch("playwright_proxy_mcp.utils.aria_processor.format_output") as mock_format:
+        mock_format.return_value = "formatted"
+
+        result = await browser_execute_bulk(
+            commands=[
+                {"tool": "browser_navigate", "args": {"url": "https://example.com"}},
+                {"tool": "browser_snapshot", "args": {}},
+                {"tool": "browser_snapshot", "args": {}, "return_result": True},
+            ]
+        )
+
+    assert result["success"] is True
+    assert len(cache) == 3
+    assert mock_format.call_count == 1
+    assert result["results"][2]["snapshot"] == "formatted"
+    assert result["results"][2]["total_items"] == 1
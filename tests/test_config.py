@@ -5,6 +5,8 @@ Tests for configuration loading
 import pytest
 from playwright_proxy_mcp.playwright.config import (
     load_blob_config,
+    load_navigation_cache_max_entries,
+    load_shutdown_timeout,
     load_pool_manager_config,
     _get_bool_env,
     _get_int_env,
@@ -81,6 +83,48 @@ class TestBlobConfig:
         assert config["ttl_hours"] == 12
 
 
+class TestShutdownTimeout:
+    """Tests for shutdown timeout configuration."""
+
+    def test_default_shutdown_timeout(self, monkeypatch):
+        """Test the shutdown deadline defaults to 10 seconds."""
+        monkeypatch.delenv("PW_MCP_PROXY_SHUTDOWN_TIMEOUT", raising=False)
+        assert load_shutdown_timeout() == 10
+
+    def test_shutdown_timeout_from_env(self, monkeypatch):
+        """Test the shutdown deadline can be overridden."""
+        monkeypatch.setenv("PW_MCP_PROXY_SHUTDOWN_TIMEOUT", "3")
+        assert load_shutdown_timeout() == 3
+
+    @pytest.mark.parametrize("value", ["0", "-5"])
+    def test_non_positive_shutdown_timeout_uses_default(self, monkeypatch, caplog, value):
+        """Test a deadline below 1 second falls back to the default with a warning."""
+        monkeypatch.setenv("PW_MCP_PROXY_SHUTDOWN_TIMEOUT", value)
+        assert load_shutdown_timeout() == 10
+        assert "PW_MCP_PROXY_SHUTDOWN_TIMEOUT" in caplog.text
+
+
+class TestNavigationCacheMaxEntries:
+    """Tests for navigation cache size configuration."""
+
+    def test_default_max_entries(self, monkeypatch):
+        """Test the cache limit defaults to 100 snapshots."""
+        monkeypatch.delenv("PW_MCP_PROXY_NAVIGATION_CACHE_MAX_ENTRIES", raising=False)
+        assert load_navigation_cache_max_entries() == 100
+
+    def test_max_entries_from_env(self, monkeypatch):
+        """Test the cache limit can be overridden."""
+        monkeypatch.setenv("PW_MCP_PROXY_NAVIGATION_CACHE_MAX_ENTRIES", "25")
+        assert load_navigation_cache_max_entries() == 25
+
+    @pytest.mark.parametrize("value", ["0", "-1"])
+    def test_non_positive_max_entries_uses_default(self, monkeypatch, caplog, value):
+        """Test a limit below 1 falls back to the default with a warning."""
+        monkeypatch.setenv("PW_MCP_PROXY_NAVIGATION_CACHE_MAX_ENTRIES", value)
+        assert load_navigation_cache_max_entries() == 100
+        assert "PW_MCP_PROXY_NAVIGATION_CACHE_MAX_ENTRIES" in caplog.text
+
+
 class TestGetBoolEnv:
     """Tests for _get_bool_env helper function."""
 
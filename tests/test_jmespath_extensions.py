@@ -1,9 +1,14 @@
 """Tests for jmespath_extensions module."""
 
+from unittest.mock import patch
+
 import pytest
 
+from playwright_proxy_mcp.utils import jmespath_extensions
 from playwright_proxy_mcp.utils.jmespath_extensions import (
     CustomFunctions,
+    compile_filter_condition,
+    compile_list_filter,
     search_with_custom_functions,
 )
 
@@ -136,6 +141,17 @@ class TestSearchWithCustomFunctions:
         result = search_with_custom_functions("items[].str(count)", data)
         assert result == ["10", "20", "30"]
 
+    def test_repeated_query_parses_once(self):
+        jmespath_extensions._compile_expression.cache_clear()
+        with patch(
+            "playwright_proxy_mcp.utils.jmespath_extensions.jmespath.compile",
+            wraps=jmespath_extensions.jmespath.compile,
+        ) as mock_compile:
+            for page in ([{"id": 1}], [{"id": 2}]):
+                assert search_with_custom_functions("[].id", page) == [page[0]["id"]]
+
+        mock_compile.assert_called_once_with("[].id")
+
     def test_regex_replace_in_query(self):
         data = {"emails": ["user1@example.com", "user2@example.com"]}
         # Extract username part
@@ -199,3 +215,35 @@ class TestSearchWithCustomFunctions:
         assert len(result) == 2
         assert result[0] == {"name": "Click me", "level": 1}
         assert result[1] == {"name": "Submit", "level": 3}
+
+
+class TestCompileListFilter:
+    """Tests for compile_list_filter"""
+
+    @pytest.mark.parametrize("expression", ["[*]", "length(@)", "[?role == 'a'] | [0]", "items[?a]"])
+    def test_non_filters_return_none(self, expression):
+        assert compile_list_filter(expression) is None
+
+    def test_per_item_results_concatenate_to_full_search(self):
+        data = [{"role": "a", "name": "x"}, {"role": "b", "name": "y"}, {"role": "a"}]
+        expression = "[?role == 'a'].name"
+
+        apply = compile_list_filter(expression)
+
+        per_item = [value for item in data for value in apply(item)]
+        assert per_item == search_with_custom_functions(expression, data) == ["x"]
+
+
+class TestCompileFilterCondition:
+    """Tests for compile_filter_condition"""
+
+    @pytest.mark.parametrize("expression", ["[*]", "[?@ == `1`]", "[?length(keys(@)) > `1`]"])
+    def test_element_reading_conditions_return_none(self, expression):
+        assert compile_filter_condition(expression) is None
+
+    def test_uses_jmespath_truthiness(self):
+        test = compile_filter_condition("[?nvl(count, `0`)]")
+
+        assert test({"count": 0}) is True
+        assert test({"count": ""}) is False
+        assert test({}) is True
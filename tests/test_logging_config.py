@@ -2,12 +2,14 @@
 
 import json
 import logging
+import logging.handlers
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from playwright_proxy_mcp.utils import logging_config
 from playwright_proxy_mcp.utils.logging_config import (
     get_logger,
     log_dict,
@@ -75,6 +77,26 @@ class TestSetupFileLogging:
             logger = setup_file_logging(log_file=log_file)
             assert logger is not None
 
+    def test_setup_file_logging_writes_through_queue(self):
+        """Test records reach the file via the background writer, formatted once"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "test.log"
+            logger = setup_file_logging(log_file=log_file, format_string="%(levelname)s|%(message)s")
+
+            assert isinstance(logger.handlers[0], logging.handlers.QueueHandler)
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logging.getLogger("queued").exception("Queued %s", "message")
+
+            # Stopping the listener flushes everything still queued
+            logging_config._stop_queue_listener()
+            content = log_file.read_text()
+
+        assert "ERROR|Queued message\n" in content
+        assert "ValueError: boom" in content
+        assert content.count("ERROR|") == 1
+
 
 class TestGetLogger:
     """Tests for get_logger function"""
@@ -142,6 +164,17 @@ class TestLogDict:
         assert "Warning:" in caplog.text
         assert "issue: test" in caplog.text
 
+    def test_log_dict_skips_iteration_when_level_disabled(self, caplog):
+        """Test log_dict does not touch the mapping when the level is filtered"""
+        logger = logging.getLogger("test_log_dict_disabled")
+        data = MagicMock()
+
+        with caplog.at_level(logging.WARNING):
+            log_dict(logger, "Quiet:", data)
+
+        data.items.assert_not_called()
+        assert "Quiet:" not in caplog.text
+
 
 class TestLogToolResult:
     """Tests for log_tool_result decorator"""
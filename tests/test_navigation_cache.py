@@ -39,6 +39,17 @@ class TestCacheEntry:
         entry.touch()
         assert entry.last_accessed > original_time
 
+    def test_store_processed_evicts_oldest_view(self):
+        entry = CacheEntry(url="https://example.com", snapshot_json=[])
+        for i in range(8):
+            entry.store_processed((False, f"[{i}]"), [i])
+
+        entry.store_processed((True, None), ["flat"])
+
+        assert len(entry.processed) == 8
+        assert (False, "[0]") not in entry.processed
+        assert entry.processed[(True, None)] == ["flat"]
+
 
 class TestNavigationCache:
     """Tests for NavigationCache class"""
@@ -58,6 +69,11 @@ class TestNavigationCache:
     def test_init_custom_ttl(self, custom_ttl_cache):
         assert custom_ttl_cache._default_ttl == 60
 
+    @pytest.mark.parametrize("max_entries", [0, -1])
+    def test_init_rejects_non_positive_max_entries(self, max_entries):
+        with pytest.raises(ValueError, match="max_entries"):
+            NavigationCache(max_entries=max_entries)
+
     def test_create_returns_key(self, cache):
         key = cache.create("https://example.com", {"data": "test"})
         assert isinstance(key, str)
@@ -168,6 +184,19 @@ class TestNavigationCache:
         assert key1 not in cache._cache
         assert key2 in cache._cache
 
+    def test_create_evicts_least_recently_used(self):
+        cache = NavigationCache(max_entries=2)
+        first = cache.create("https://a.com", [])
+        second = cache.create("https://b.com", [])
+        cache.get(first)  # first is now most recently used
+
+        third = cache.create("https://c.com", [])
+
+        assert len(cache) == 2
+        assert cache.get(second) is None
+        assert cache.get(first) is not None
+        assert cache.get(third) is not None
+
     def test_len(self, cache):
         assert len(cache) == 0
         cache.create("https://example.com", {"data": "test1"})
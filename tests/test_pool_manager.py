@@ -158,6 +158,49 @@ class TestBrowserPool:
             assert mock_create.call_count == 2
             assert browser_pool.lease_queue is not None
 
+    async def test_initialize_starts_instances_concurrently(
+        self, browser_pool, mock_blob_manager, mock_middleware
+    ):
+        """Test instances start in parallel but keep configuration order."""
+        started = []
+
+        async def create(instance_cfg, blob_manager, middleware):
+            instance_id = instance_cfg["instance_id"]
+            started.append(instance_id)
+            # Both creations must be in flight at once for this to complete
+            while len(started) < 2:
+                await asyncio.sleep(0)
+            if instance_id == "0":
+                # Finish after instance 1
+                await asyncio.sleep(0.01)
+            instance = Mock(spec=BrowserInstance)
+            instance.alias = instance_cfg["alias"]
+            browser_pool.instances[instance_id] = instance
+
+        with patch.object(browser_pool, "_create_instance", new=create):
+            await asyncio.wait_for(
+                browser_pool.initialize(mock_blob_manager, mock_middleware), timeout=1.0
+            )
+
+        assert list(browser_pool.instances) == ["0", "1"]
+        assert browser_pool._key_index["debug"] == "1"
+
+    async def test_initialize_failure_keeps_started_instances(
+        self, browser_pool, mock_blob_manager, mock_middleware
+    ):
+        """Test a failed instance raises while started ones remain stoppable."""
+
+        async def create(instance_cfg, blob_manager, middleware):
+            if instance_cfg["instance_id"] == "1":
+                raise RuntimeError("instance 1 failed to start")
+            browser_pool.instances["0"] = Mock(spec=BrowserInstance)
+
+        with patch.object(browser_pool, "_create_instance", new=create):
+            with pytest.raises(RuntimeError, match="instance 1 failed"):
+                await browser_pool.initialize(mock_blob_manager, mock_middleware)
+
+        assert list(browser_pool.instances) == ["0"]
+
     async def test_create_instance(self, browser_pool, mock_blob_manager, mock_middleware):
         instance_cfg = InstanceConfig(
             instance_id="0",
@@ -510,6 +553,15 @@ class TestBrowserInstanceAdditional:
         instance.mark_released()
         assert instance.lease_started_at is None
 
+    def test_lease_started_at_round_trips_assigned_datetime(self, instance):
+        """Test assigning lease_started_at keeps microsecond precision and UTC."""
+        started = datetime(2024, 5, 1, 12, 30, 45, 123456, tzinfo=timezone.utc)
+        instance.lease_started_at = started
+
+        assert instance.is_leased
+        assert instance.lease_started_at == started
+        assert instance.lease_started_at.tzinfo == timezone.utc
+
     async def test_check_health_returns_true_when_healthy(self, instance, mock_proxy_client):
         """Test check_health returns True when proxy client is healthy."""
         mock_proxy_client.is_healthy.return_value = True
@@ -581,6 +633,23 @@ class TestBrowserPoolAdditional:
         instance0.check_health.assert_awaited_once()
         instance1.check_health.assert_awaited_once()
 
+    async def test_check_all_health_isolates_crashing_check(self, browser_pool):
+        """Test a raising check_health marks that instance unhealthy without aborting others."""
+        instance0 = AsyncMock()
+        instance0.instance_id = "0"
+        instance0.check_health = AsyncMock(side_effect=RuntimeError("boom"))
+        instance1 = AsyncMock()
+        instance1.instance_id = "1"
+        instance1.check_health = AsyncMock(return_value=True)
+
+        browser_pool.instances["0"] = instance0
+        browser_pool.instances["1"] = instance1
+
+        await browser_pool.check_all_health()
+
+        assert instance0.health_check_error == "boom"
+        instance1.check_health.assert_awaited_once()
+
 
 class TestPoolManagerAdditional:
     """Additional tests for PoolManager."""
@@ -699,6 +768,30 @@ class TestPoolManagerAdditional:
             # stop should be called for each pool
             assert mock_pool.stop.await_count == 2
 
+    async def test_stop_gives_up_after_timeout(
+        self, multi_pool_config, mock_blob_manager, mock_middleware
+    ):
+        """Test stop cancels pools that hang past the shutdown deadline."""
+        manager = PoolManager(multi_pool_config, mock_blob_manager, mock_middleware)
+        cancelled = []
+
+        async def hang():
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        with patch("playwright_proxy_mcp.playwright.pool_manager.BrowserPool") as MockPool:
+            mock_pool = AsyncMock()
+            mock_pool.stop = AsyncMock(side_effect=hang)
+            MockPool.return_value = mock_pool
+
+            await manager.initialize()
+            await asyncio.wait_for(manager.stop(timeout=0.05), timeout=1.0)
+
+        assert cancelled == [True, True]
+
 
 class TestBrowserPoolLeasing:
     """Tests for BrowserPool leasing functionality."""
@@ -792,6 +885,62 @@ class TestBrowserPoolLeasing:
             assert instance_id == "0"
             instance0.mark_leased.assert_called_once()
 
+    async def _initialize_two_instances(self, browser_pool):
+        """Populate the pool with two mock instances ("0"/first, "1"/second)."""
+        instances = {}
+        for instance_id, alias in (("0", "first"), ("1", "second")):
+            instance = Mock(spec=BrowserInstance)
+            instance.instance_id = instance_id
+            instance.alias = alias
+            instance.proxy_client = Mock()
+            instances[instance_id] = instance
+
+        async def mock_create_instance(cfg, bm, mw):
+            browser_pool.instances[cfg["instance_id"]] = instances[cfg["instance_id"]]
+
+        with patch.object(browser_pool, "_create_instance", new=mock_create_instance):
+            await browser_pool.initialize(Mock(), Mock())
+
+    async def test_alias_lease_excludes_instance_from_fifo(self, browser_pool):
+        """Test FIFO leasing skips an instance held via its alias."""
+        await self._initialize_two_instances(browser_pool)
+
+        async with browser_pool.lease_instance("first") as (_, held_id):
+            assert held_id == "0"
+            async with browser_pool.lease_instance() as (_, fifo_id):
+                assert fifo_id == "1"
+
+    async def test_alias_and_id_share_exclusive_lock(self, browser_pool):
+        """Test leasing by ID waits while the same instance is leased by alias."""
+        await self._initialize_two_instances(browser_pool)
+
+        async with browser_pool.lease_instance("first"):
+            waiter = asyncio.create_task(self._lease_once(browser_pool, "0"))
+            await asyncio.sleep(0.01)
+            assert not waiter.done()
+
+        assert await asyncio.wait_for(waiter, timeout=1.0) == "0"
+
+    async def test_waiting_for_busy_instance_does_not_block_fifo(self, browser_pool):
+        """Test a targeted waiter does not hold up FIFO leases of other instances."""
+        await self._initialize_two_instances(browser_pool)
+
+        async with browser_pool.lease_instance("0"):
+            waiter = asyncio.create_task(self._lease_once(browser_pool, "first"))
+            await asyncio.sleep(0)
+
+            async with browser_pool.lease_instance() as (_, fifo_id):
+                assert fifo_id == "1"
+
+            assert not waiter.done()
+
+        assert await asyncio.wait_for(waiter, timeout=1.0) == "0"
+
+    @staticmethod
+    async def _lease_once(browser_pool, key):
+        async with browser_pool.lease_instance(key) as (_, instance_id):
+            return instance_id
+
 
 class TestPoolManagerHealthCheck:
     """Tests for PoolManager health check functionality."""
@@ -960,6 +1109,63 @@ class TestBrowserPoolStatus:
         assert status["instances"][0]["status"] == "failed"
         assert status["instances"][0]["health_check"]["error"] == "Connection refused"
 
+    def _add_real_instance(self, browser_pool):
+        process_manager = Mock()
+        process_manager.process = None
+        instance = BrowserInstance(
+            instance_id="0",
+            alias=None,
+            proxy_client=AsyncMock(),
+            process_manager=process_manager,
+            on_state_change=browser_pool._invalidate_status,
+        )
+        browser_pool.instances["0"] = instance
+        return instance
+
+    async def test_get_status_reuses_cache_until_state_changes(self, browser_pool):
+        """Test get_status is rebuilt only after lease/health changes."""
+        instance = self._add_real_instance(browser_pool)
+
+        with patch.object(
+            browser_pool, "_build_status", wraps=browser_pool._build_status
+        ) as build:
+            await browser_pool.get_status()
+            await browser_pool.get_status()
+            assert build.call_count == 1
+
+            instance.mark_leased()
+            status = await browser_pool.get_status()
+            assert build.call_count == 2
+            assert status["leased_instances"] == 1
+
+            instance.proxy_client.is_healthy = AsyncMock(return_value=False)
+            await instance.check_health()
+            status = await browser_pool.get_status()
+            assert build.call_count == 3
+            assert status["healthy_instances"] == 0
+
+    async def test_get_status_refreshes_lease_duration(self, browser_pool):
+        """Test cached status still reports a current lease duration."""
+        instance = self._add_real_instance(browser_pool)
+        instance.mark_leased()
+
+        first = await browser_pool.get_status()
+        await asyncio.sleep(0.02)
+        second = await browser_pool.get_status()
+
+        assert second["instances"][0]["lease_duration_ms"] > first["instances"][0]["lease_duration_ms"]
+
+    async def test_get_status_returns_copies(self, browser_pool):
+        """Test mutating a returned status does not affect the cache."""
+        self._add_real_instance(browser_pool)
+
+        status = await browser_pool.get_status()
+        status["instances"][0]["status"] = "mutated"
+        status["instances"].clear()
+
+        fresh = await browser_pool.get_status()
+        assert fresh["instances"][0]["status"] == "healthy"
+
 
 class TestBrowserInstanceProperties:
     """Tests for BrowserInstance property methods."""
@@ -3,11 +3,16 @@ Tests for playwright process manager
 """
 
 import asyncio
+import os
+import sys
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from playwright_proxy_mcp.playwright.process_manager import PlaywrightProcessManager
+from playwright_proxy_mcp.playwright.process_manager import (
+    PlaywrightProcessManager,
+    install_pidfd_child_watcher,
+)
 
 
 @pytest.fixture
@@ -25,12 +30,12 @@ def mock_subprocess():
 
     # Mock stdout stream
     mock_stdout = Mock()
-    mock_stdout.readline = AsyncMock(return_value=b"")
+    mock_stdout.read = AsyncMock(return_value=b"")
     mock_process.stdout = mock_stdout
 
     # Mock stderr stream
     mock_stderr = Mock()
-    mock_stderr.readline = AsyncMock(return_value=b"")
+    mock_stderr.read = AsyncMock(return_value=b"")
     mock_process.stderr = mock_stderr
 
     return mock_process
@@ -42,25 +47,24 @@ class TestPlaywrightProcessManager:
     def test_init(self, process_manager):
         """Test process manager initialization."""
         assert process_manager.process is None
-        assert not process_manager._shutdown_event.is_set()
 
     @pytest.mark.asyncio
     async def test_is_healthy_no_process(self, process_manager):
         """Test is_healthy returns False when no process."""
-        assert await process_manager.is_healthy() is False
+        assert process_manager.is_healthy() is False
 
     @pytest.mark.asyncio
     async def test_is_healthy_process_running(self, process_manager, mock_subprocess):
         """Test is_healthy returns True when process is running."""
         await process_manager.set_process(mock_subprocess)
-        assert await process_manager.is_healthy() is True
+        assert process_manager.is_healthy() is True
 
     @pytest.mark.asyncio
     async def test_is_healthy_process_exited(self, process_manager, mock_subprocess):
         """Test is_healthy returns False when process has exited."""
         mock_subprocess.returncode = 0
         await process_manager.set_process(mock_subprocess)
-        assert await process_manager.is_healthy() is False
+        assert process_manager.is_healthy() is False
 
     @pytest.mark.asyncio
     async def test_set_process(self, process_manager, mock_subprocess):
@@ -93,6 +97,24 @@ class TestPlaywrightProcessManager:
 
         assert process_manager.process is None
 
+    @pytest.mark.asyncio
+    async def test_stop_cancels_blocked_logging_tasks(self, process_manager, mock_subprocess):
+        """Test stop cancels both logging tasks while they are waiting on output."""
+        never = asyncio.Event()
+
+        async def block(_size):
+            await never.wait()
+
+        mock_subprocess.stdout.read = AsyncMock(side_effect=block)
+        mock_subprocess.stderr.read = AsyncMock(side_effect=block)
+        await process_manager.set_process(mock_subprocess)
+        await asyncio.sleep(0)
+
+        await process_manager.stop()
+
+        assert process_manager._stdout_task.cancelled()
+        assert process_manager._stderr_task.cancelled()
+
     @pytest.mark.asyncio
     async def test_stop_no_process(self, process_manager):
         """Test stop when no process is set."""
@@ -114,11 +136,11 @@ class TestPlaywrightProcessManager:
         line_iter = iter(lines)
 
         mock_stdout = Mock()
-        mock_stdout.readline = AsyncMock(side_effect=lambda: next(line_iter))
+        mock_stdout.read = AsyncMock(side_effect=lambda _size: next(line_iter))
         mock_process.stdout = mock_stdout
 
         mock_stderr = Mock()
-        mock_stderr.readline = AsyncMock(return_value=b"")
+        mock_stderr.read = AsyncMock(return_value=b"")
         mock_process.stderr = mock_stderr
 
         process_manager.process = mock_process
@@ -129,6 +151,79 @@ class TestPlaywrightProcessManager:
         assert "UPSTREAM_MCP [stdout] Line 1" in caplog.text
         assert "UPSTREAM_MCP [stdout] Line 2" in caplog.text
 
+    @pytest.mark.asyncio
+    async def test_log_stdout_joins_lines_split_across_chunks(self, process_manager, caplog):
+        """Test lines split across reads are reassembled and a trailing line is flushed."""
+        import logging
+
+        mock_process = Mock()
+        chunks = iter([b"first li", "ne é".encode()[:-1], "é\nsecond\nthi".encode()[1:], b"rd", b""])
+        mock_process.stdout = Mock()
+        mock_process.stdout.read = AsyncMock(side_effect=lambda _size: next(chunks))
+
+        process_manager.process = mock_process
+
+        with caplog.at_level(logging.INFO):
+            await process_manager._log_stdout()
+
+        messages = [r.getMessage() for r in caplog.records if "UPSTREAM_MCP" in r.getMessage()]
+        # Lines completed by the same read share one record; the unterminated
+        # tail is flushed as its own record at EOF
+        assert messages == [
+            "UPSTREAM_MCP [stdout] first line é\nUPSTREAM_MCP [stdout] second",
+            "UPSTREAM_MCP [stdout] third",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_log_stdout_flushes_overlong_unterminated_line(self, process_manager, caplog, monkeypatch):
+        """Test output without newlines is logged once it passes the buffer cap."""
+        import logging
+
+        from playwright_proxy_mcp.playwright import process_manager as process_manager_module
+
+        monkeypatch.setattr(process_manager_module, "_MAX_PENDING_LINE_BYTES", 8)
+
+        mock_process = Mock()
+        chunks = iter([b"abcde", b"fghij", b"kl", b"\nok\n", b""])
+        mock_process.stdout = Mock()
+        mock_process.stdout.read = AsyncMock(side_effect=lambda _size: next(chunks))
+
+        process_manager.process = mock_process
+
+        with caplog.at_level(logging.INFO):
+            await process_manager._log_stdout()
+
+        messages = [r.getMessage() for r in caplog.records if "UPSTREAM_MCP" in r.getMessage()]
+        assert messages == [
+            "UPSTREAM_MCP [stdout] abcdefghij",
+            "UPSTREAM_MCP [stdout] kl\nUPSTREAM_MCP [stdout] ok",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_log_stdout_overlong_flush_keeps_partial_character(self, process_manager, caplog, monkeypatch):
+        """Test the buffer cap never splits a multi-byte character."""
+        import logging
+
+        from playwright_proxy_mcp.playwright import process_manager as process_manager_module
+
+        monkeypatch.setattr(process_manager_module, "_MAX_PENDING_LINE_BYTES", 8)
+
+        mock_process = Mock()
+        chunks = iter([b"abcdefg\xc3", b"\xa9h\n", b""])
+        mock_process.stdout = Mock()
+        mock_process.stdout.read = AsyncMock(side_effect=lambda _size: next(chunks))
+
+        process_manager.process = mock_process
+
+        with caplog.at_level(logging.INFO):
+            await process_manager._log_stdout()
+
+        messages = [r.getMessage() for r in caplog.records if "UPSTREAM_MCP" in r.getMessage()]
+        assert messages == [
+            "UPSTREAM_MCP [stdout] abcdefg",
+            "UPSTREAM_MCP [stdout] éh",
+        ]
+
     @pytest.mark.asyncio
     async def test_log_stderr_reads_lines(self, process_manager, caplog):
         """Test that _log_stderr reads and logs stderr lines."""
@@ -139,7 +234,7 @@ class TestPlaywrightProcessManager:
         mock_process.returncode = None
 
         mock_stdout = Mock()
-        mock_stdout.readline = AsyncMock(return_value=b"")
+        mock_stdout.read = AsyncMock(return_value=b"")
         mock_process.stdout = mock_stdout
 
         # Return lines then empty
@@ -147,7 +242,7 @@ class TestPlaywrightProcessManager:
         line_iter = iter(lines)
 
         mock_stderr = Mock()
-        mock_stderr.readline = AsyncMock(side_effect=lambda: next(line_iter))
+        mock_stderr.read = AsyncMock(side_effect=lambda _size: next(line_iter))
         mock_process.stderr = mock_stderr
 
         process_manager.process = mock_process
@@ -189,7 +284,7 @@ class TestPlaywrightProcessManager:
 
         mock_process = Mock()
         mock_process.stdout = Mock()
-        mock_process.stdout.readline = AsyncMock(side_effect=RuntimeError("Read error"))
+        mock_process.stdout.read = AsyncMock(side_effect=RuntimeError("Read error"))
 
         process_manager.process = mock_process
 
@@ -205,7 +300,7 @@ class TestPlaywrightProcessManager:
 
         mock_process = Mock()
         mock_process.stderr = Mock()
-        mock_process.stderr.readline = AsyncMock(side_effect=RuntimeError("Read error"))
+        mock_process.stderr.read = AsyncMock(side_effect=RuntimeError("Read error"))
 
         process_manager.process = mock_process
 
@@ -221,7 +316,7 @@ class TestPlaywrightProcessManager:
 
         mock_process = Mock()
         mock_process.stdout = Mock()
-        mock_process.stdout.readline = AsyncMock(side_effect=asyncio.CancelledError())
+        mock_process.stdout.read = AsyncMock(side_effect=asyncio.CancelledError())
 
         process_manager.process = mock_process
 
@@ -235,7 +330,7 @@ class TestPlaywrightProcessManager:
 
         mock_process = Mock()
         mock_process.stderr = Mock()
-        mock_process.stderr.readline = AsyncMock(side_effect=asyncio.CancelledError())
+        mock_process.stderr.read = AsyncMock(side_effect=asyncio.CancelledError())
 
         process_manager.process = mock_process
 
@@ -255,7 +350,7 @@ class TestPlaywrightProcessManager:
         line_iter = iter(lines)
 
         mock_stdout = Mock()
-        mock_stdout.readline = AsyncMock(side_effect=lambda: next(line_iter))
+        mock_stdout.read = AsyncMock(side_effect=lambda _size: next(line_iter))
         mock_process.stdout = mock_stdout
 
         process_manager.process = mock_process
@@ -279,7 +374,7 @@ class TestPlaywrightProcessManager:
         line_iter = iter(lines)
 
         mock_stderr = Mock()
-        mock_stderr.readline = AsyncMock(side_effect=lambda: next(line_iter))
+        mock_stderr.read = AsyncMock(side_effect=lambda _size: next(line_iter))
         mock_process.stderr = mock_stderr
 
         process_manager.process = mock_process
@@ -335,7 +430,7 @@ class TestPlaywrightProcessManager:
         mock_subprocess.returncode = None
         await process_manager.set_process(mock_subprocess)
 
-        result = await process_manager.is_healthy()
+        result = process_manager.is_healthy()
         assert result is True
 
         # Clean up
@@ -347,7 +442,7 @@ class TestPlaywrightProcessManager:
         mock_subprocess.returncode = 1
         await process_manager.set_process(mock_subprocess)
 
-        result = await process_manager.is_healthy()
+        result = process_manager.is_healthy()
         assert result is False
 
         # Clean up
@@ -367,18 +462,6 @@ class TestPlaywrightProcessManager:
         # Clean up
         await process_manager.stop()
 
-    @pytest.mark.asyncio
-    async def test_shutdown_event_exists(self, process_manager, mock_subprocess):
-        """Test that shutdown event is created."""
-        await process_manager.set_process(mock_subprocess)
-
-        # Shutdown event should exist
-        assert hasattr(process_manager, "_shutdown_event")
-        assert process_manager._shutdown_event is not None
-
-        # Clean up
-        await process_manager.stop()
-
     @pytest.mark.asyncio
     async def test_multiple_stop_calls(self, process_manager, mock_subprocess):
         """Test that multiple stop calls are safe."""
@@ -414,3 +497,37 @@ class TestPlaywrightProcessManager:
         # Stop should still work
         await process_manager.stop()
         assert process_manager.process is None
+
+
+@pytest.mark.skipif(
+    sys.platform != "linux" or sys.version_info >= (3, 12) or not hasattr(os, "pidfd_open"),
+    reason="pidfd child watcher is only installed on Linux before Python 3.12",
+)
+class TestInstallPidfdChildWatcher:
+    """Tests for install_pidfd_child_watcher."""
+
+    @pytest.fixture(autouse=True)
+    def restore_child_watcher(self):
+        policy = asyncio.get_event_loop_policy()
+        original = policy.get_child_watcher()
+        yield
+        policy.set_child_watcher(original)
+
+    async def test_installs_watcher_and_reaps_child(self):
+        """Test the pidfd watcher is installed and reports child exit codes."""
+        try:
+            os.close(os.pidfd_open(os.getpid()))
+        except OSError:
+            pytest.skip("kernel does not support pidfd_open")
+
+        assert install_pidfd_child_watcher() is True
+        watcher = asyncio.get_event_loop_policy().get_child_watcher()
+        assert isinstance(watcher, asyncio.PidfdChildWatcher)
+        assert watcher.is_active()
+
+        # Second call keeps the same watcher
+        assert install_pidfd_child_watcher() is True
+        assert asyncio.get_event_loop_policy().get_child_watcher() is watcher
+
+        process = await asyncio.create_subprocess_exec(sys.executable, "-c", "raise SystemExit(3)")
+        assert await asyncio.wait_for(process.wait(), timeout=10) == 3
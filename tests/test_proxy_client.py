@@ -3,12 +3,36 @@ Tests for playwright proxy client
 """
 
 import asyncio
+import subprocess
+import time
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
+from playwright_proxy_mcp.playwright import proxy_client as proxy_client_module
 from playwright_proxy_mcp.playwright.proxy_client import PlaywrightProxyClient
 
+_locate_global_playwright_cli = proxy_client_module._locate_global_playwright_cli
+
+
+@pytest.fixture(autouse=True)
+def clear_path_caches(monkeypatch):
+    """Reset module-level caches so each test sees its own shutil.which/subprocess patches.
+
+    Global @playwright/mcp discovery is disabled so commands fall back to npx
+    regardless of what is installed on the machine running the tests.
+    """
+    proxy_client_module._executable_cache.clear()
+    proxy_client_module._windows_path_cache.clear()
+    proxy_client_module._npm_root_cache.clear()
+    proxy_client_module.clear_tools_cache()
+    monkeypatch.setattr(proxy_client_module, "_locate_global_playwright_cli", lambda: None)
+    yield
+    proxy_client_module._executable_cache.clear()
+    proxy_client_module._windows_path_cache.clear()
+    proxy_client_module._npm_root_cache.clear()
+    proxy_client_module.clear_tools_cache()
+
 
 @pytest.fixture
 def mock_process_manager():
@@ -16,7 +40,7 @@ def mock_process_manager():
     manager = Mock()
     manager.set_process = AsyncMock()
     manager.stop = AsyncMock()
-    manager.is_healthy = AsyncMock(return_value=True)
+    manager.is_healthy = Mock(return_value=True)
     manager.process = None
     return manager
 
@@ -71,6 +95,32 @@ class TestPlaywrightProxyClient:
         assert proxy_client._client is not None
         assert proxy_client._transport is not None
 
+    @pytest.mark.asyncio
+    async def test_start_builds_command_off_event_loop(self, proxy_client, monkeypatch):
+        """Test the global install lookup (which may run npm) happens in a worker thread."""
+        import threading
+
+        lookup_threads = []
+
+        def locate():
+            lookup_threads.append(threading.current_thread())
+            return None
+
+        monkeypatch.setattr(proxy_client_module, "_locate_global_playwright_cli", locate)
+
+        mock_client = Mock()
+        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+        mock_client.__aexit__ = AsyncMock()
+        mock_client.list_tools = AsyncMock(return_value=[])
+
+        with patch('playwright_proxy_mcp.playwright.proxy_client.StdioTransport', return_value=Mock()):
+            with patch('playwright_proxy_mcp.playwright.proxy_client.Client', return_value=mock_client):
+                with patch('playwright_proxy_mcp.playwright.proxy_client.shutil.which', return_value='/usr/bin/npx'):
+                    await proxy_client.start({"browser": "chromium"})
+
+        assert len(lookup_threads) == 1
+        assert lookup_threads[0] is not threading.main_thread()
+
     @pytest.mark.asyncio
     async def test_start_already_started(self, proxy_client):
         """Test starting when already started."""
@@ -159,6 +209,88 @@ class TestPlaywrightProxyClient:
 
         assert not await proxy_client.is_healthy()
 
+    @pytest.mark.asyncio
+    async def test_is_healthy_opens_circuit_after_repeated_failures(self, proxy_client):
+        """Test consecutive ping failures stop probing until the cooldown passes."""
+        proxy_client._started = True
+
+        mock_client = Mock()
+        mock_client.ping = AsyncMock(side_effect=Exception("Connection failed"))
+        proxy_client._client = mock_client
+
+        for _ in range(3):
+            # Let the short negative cache from the previous failure expire
+            proxy_client._health_cache = None
+            assert not await proxy_client.is_healthy()
+        assert mock_client.ping.await_count == 3
+
+        # Circuit is open: the negative result is held for the cooldown
+        expires_at, healthy = proxy_client._health_cache
+        assert healthy is False
+        assert expires_at - time.monotonic() > 1.0
+        assert not await proxy_client.is_healthy()
+        assert mock_client.ping.await_count == 3
+
+        # After the cooldown a successful ping closes the circuit again
+        mock_client.ping = AsyncMock(return_value=True)
+        proxy_client._health_cache = None
+        assert await proxy_client.is_healthy()
+        assert proxy_client._health_failures == 0
+        mock_client.ping.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_is_healthy_concurrent_callers_share_one_ping(self, proxy_client):
+        """Test concurrent health checks are coalesced into a single ping."""
+        proxy_client._started = True
+        release = asyncio.Event()
+
+        async def ping():
+            await release.wait()
+            return True
+
+        mock_client = Mock()
+        mock_client.ping = AsyncMock(side_effect=ping)
+        proxy_client._client = mock_client
+
+        checks = [asyncio.create_task(proxy_client.is_healthy()) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*checks) == [True] * 5
+        mock_client.ping.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_is_healthy_reuses_recent_success(self, proxy_client):
+        """Test a healthy result is reused within the cache window."""
+        proxy_client._started = True
+
+        mock_client = Mock()
+        mock_client.ping = AsyncMock(return_value=True)
+        proxy_client._client = mock_client
+
+        assert await proxy_client.is_healthy()
+        assert await proxy_client.is_healthy()
+        mock_client.ping.assert_awaited_once()
+
+        # Once the window has passed the next call pings again
+        proxy_client._health_cache = None
+        assert await proxy_client.is_healthy()
+        assert mock_client.ping.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_is_healthy_briefly_reuses_failure(self, proxy_client):
+        """Test a failed ping is reported again without re-probing for a short window."""
+        proxy_client._started = True
+
+        mock_client = Mock()
+        mock_client.ping = AsyncMock(side_effect=Exception("Connection failed"))
+        proxy_client._client = mock_client
+
+        assert not await proxy_client.is_healthy()
+        assert not await proxy_client.is_healthy()
+        mock_client.ping.assert_awaited_once()
+        assert proxy_client._health_failures == 1
+
     @pytest.mark.asyncio
     async def test_call_tool(self, proxy_client, mock_middleware):
         """Test calling a tool."""
@@ -553,6 +685,13 @@ class TestProxyClientHelperMethods:
         proxy_client._add_timeout_args(command, config)
         assert command == ["--image-responses", "omit"]
 
+    def test_add_timeout_args_keeps_falsy_present_values(self, proxy_client):
+        """Test presence-based timeout options are passed even when falsy."""
+        command = []
+        config = {"timeout_action": 0, "timeout_navigation": 0}
+        proxy_client._add_timeout_args(command, config)
+        assert command == ["--timeout-action", "0", "--timeout-navigation", "0"]
+
     def test_add_stealth_args_with_user_agent(self, proxy_client):
         """Test _add_stealth_args with user_agent."""
         command = []
@@ -714,6 +853,74 @@ class TestProxyClientToolCalls:
         assert "browser_navigate" in proxy_client._available_tools
         assert proxy_client._available_tools["browser_navigate"]["description"] == "Navigate to URL"
 
+    async def test_discover_tools_shared_between_identical_commands(
+        self, mock_process_manager, mock_middleware
+    ):
+        """Test clients with the same command list tools only once, even concurrently."""
+        mock_tool = Mock()
+        mock_tool.name = "browser_navigate"
+        mock_tool.description = "Navigate to URL"
+        mock_tool.inputSchema = {"type": "object"}
+
+        async def list_tools():
+            await asyncio.sleep(0.01)
+            return [mock_tool]
+
+        mock_client = Mock()
+        mock_client.list_tools = AsyncMock(side_effect=list_tools)
+
+        clients = [PlaywrightProxyClient(mock_process_manager, mock_middleware) for _ in range(3)]
+        for client in clients:
+            client._client = mock_client
+            client._command_key = ("/usr/bin/npx", "@playwright/mcp@latest")
+
+        await asyncio.gather(*(client._discover_tools() for client in clients[:2]))
+        await clients[2]._discover_tools()
+
+        mock_client.list_tools.assert_awaited_once()
+        assert all("browser_navigate" in client.get_available_tools() for client in clients)
+
+        # A different command discovers its own tools
+        other = PlaywrightProxyClient(mock_process_manager, mock_middleware)
+        other._client = mock_client
+        other._command_key = ("/usr/bin/npx", "@playwright/mcp@latest", "--caps", "pdf")
+        await other._discover_tools()
+        assert mock_client.list_tools.await_count == 2
+
+    async def test_discover_tools_falls_back_when_shared_listing_fails(
+        self, mock_process_manager, mock_middleware
+    ):
+        """Test a failed shared listing does not fail clients waiting on it."""
+        mock_tool = Mock()
+        mock_tool.name = "browser_navigate"
+        mock_tool.description = "Navigate to URL"
+        mock_tool.inputSchema = {"type": "object"}
+
+        async def broken_list_tools():
+            await asyncio.sleep(0.01)
+            raise ConnectionError("session closed")
+
+        broken_client = Mock()
+        broken_client.list_tools = AsyncMock(side_effect=broken_list_tools)
+        healthy_client = Mock()
+        healthy_client.list_tools = AsyncMock(return_value=[mock_tool])
+
+        first = PlaywrightProxyClient(mock_process_manager, mock_middleware)
+        first._client = broken_client
+        second = PlaywrightProxyClient(mock_process_manager, mock_middleware)
+        second._client = healthy_client
+        for client in (first, second):
+            client._command_key = ("/usr/bin/npx", "@playwright/mcp@latest")
+
+        results = await asyncio.gather(
+            first._discover_tools(), second._discover_tools(), return_exceptions=True
+        )
+
+        assert isinstance(results[0], RuntimeError)
+        assert results[1] is None
+        healthy_client.list_tools.assert_awaited_once()
+        assert "browser_navigate" in second.get_available_tools()
+
     async def test_call_tool_exception_handling(self, proxy_client):
         """Test exception handling in call_tool."""
         proxy_client._started = True
@@ -757,6 +964,87 @@ class TestProxyClientBaseCommand:
             with pytest.raises(RuntimeError, match="npx not found"):
                 proxy_client._build_standard_command()
 
+    def test_build_standard_command_reuses_resolved_npx(self, proxy_client, tmp_path):
+        """Test npx is resolved once and reused while the path still exists."""
+        npx = tmp_path / "npx"
+        npx.write_text("#!/bin/sh\n")
+        npx.chmod(0o755)
+
+        with patch(
+            'playwright_proxy_mcp.playwright.proxy_client.shutil.which', return_value=str(npx)
+        ) as mock_which:
+            assert proxy_client._build_standard_command() == [str(npx)]
+            assert proxy_client._build_standard_command() == [str(npx)]
+        mock_which.assert_called_once_with("npx")
+
+    def test_build_standard_command_re_resolves_missing_npx(self, proxy_client, tmp_path):
+        """Test a cached npx path that disappeared triggers a fresh PATH lookup."""
+        npx = tmp_path / "npx"
+        npx.write_text("#!/bin/sh\n")
+        npx.chmod(0o755)
+
+        with patch('playwright_proxy_mcp.playwright.proxy_client.shutil.which', return_value=str(npx)):
+            proxy_client._build_standard_command()
+
+        npx.unlink()
+        with patch(
+            'playwright_proxy_mcp.playwright.proxy_client.shutil.which', return_value='/usr/local/bin/npx'
+        ) as mock_which:
+            assert proxy_client._build_standard_command() == ['/usr/local/bin/npx']
+        mock_which.assert_called_once_with("npx")
+
+    def test_build_command_prefers_global_install(self, proxy_client, monkeypatch):
+        """Test a global @playwright/mcp is launched with node instead of npx."""
+        cli = '/usr/lib/node_modules/@playwright/mcp/cli.js'
+        monkeypatch.setattr(proxy_client_module, "_locate_global_playwright_cli", lambda: cli)
+
+        with patch('playwright_proxy_mcp.playwright.proxy_client.shutil.which', return_value='/usr/bin/node'):
+            command = proxy_client._build_command({"headless": True})
+
+        assert command == ['/usr/bin/node', cli, '--headless']
+
+    def test_build_command_wsl_ignores_global_install(self, proxy_client, monkeypatch):
+        """Test WSL->Windows mode keeps using Windows npx.cmd."""
+        monkeypatch.setattr(
+            proxy_client_module, "_locate_global_playwright_cli", lambda: '/usr/lib/node_modules/@playwright/mcp/cli.js'
+        )
+
+        with patch('playwright_proxy_mcp.playwright.proxy_client.shutil.which', return_value='/mnt/c/Windows/System32/cmd.exe'):
+            command = proxy_client._build_command({"wsl_windows": True})
+
+        assert command[1:4] == ['/c', 'npx.cmd', '@playwright/mcp@latest']
+
+    def test_locate_global_cli_runs_npm_root_once(self, tmp_path):
+        """Test `npm root -g` is cached while the cli.js check is repeated."""
+        cli = tmp_path / "@playwright" / "mcp" / "cli.js"
+        cli.parent.mkdir(parents=True)
+        cli.write_text("")
+
+        with patch('playwright_proxy_mcp.playwright.proxy_client.shutil.which', return_value='/usr/bin/npm'), \
+             patch('playwright_proxy_mcp.playwright.proxy_client.os.access', return_value=True), \
+             patch('playwright_proxy_mcp.playwright.proxy_client.subprocess.run') as mock_run:
+            mock_run.return_value = Mock(stdout=f"{tmp_path}\n")
+            assert _locate_global_playwright_cli() == str(cli)
+
+            cli.unlink()
+            assert _locate_global_playwright_cli() is None
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args.args[0] == ['/usr/bin/npm', 'root', '-g']
+
+    def test_locate_global_cli_npm_failure(self):
+        """Test a failing `npm root -g` falls back to npx and is not retried."""
+        with patch('playwright_proxy_mcp.playwright.proxy_client.shutil.which', return_value='/usr/bin/npm'), \
+             patch('playwright_proxy_mcp.playwright.proxy_client.os.access', return_value=True), \
+             patch(
+                 'playwright_proxy_mcp.playwright.proxy_client.subprocess.run',
+                 side_effect=subprocess.TimeoutExpired(cmd="npm", timeout=10),
+             ) as mock_run:
+            assert _locate_global_playwright_cli() is None
+            assert _locate_global_playwright_cli() is None
+
+        mock_run.assert_called_once()
+
     def test_build_wsl_windows_command_success(self, proxy_client):
         """Test _build_wsl_windows_command with cmd.exe available."""
         with patch('playwright_proxy_mcp.playwright.proxy_client.shutil.which', return_value='/mnt/c/Windows/System32/cmd.exe'):
@@ -788,6 +1076,17 @@ class TestProxyClientBaseCommand:
             check=True,
         )
 
+    def test_wsl_to_windows_path_reuses_conversion(self, proxy_client):
+        """Test repeated conversions of the same path run wslpath only once."""
+        with patch('playwright_proxy_mcp.playwright.proxy_client.subprocess.run') as mock_run:
+            mock_run.return_value = Mock(stdout="C:\\scripts\\init.js\n")
+
+            first = proxy_client._wsl_to_windows_path("/opt/scripts/init.js")
+            second = proxy_client._wsl_to_windows_path("/opt/scripts/init.js")
+
+        assert first == second == "C:\\scripts\\init.js"
+        mock_run.assert_called_once()
+
     def test_wsl_to_windows_path_command_error(self, proxy_client):
         """Test _wsl_to_windows_path handles wslpath command errors."""
         import subprocess as sp
@@ -817,7 +1116,7 @@ class TestProxyClientEdgeCases:
         manager = Mock()
         manager.set_process = AsyncMock()
         manager.stop = AsyncMock()
-        manager.is_healthy = AsyncMock(return_value=True)
+        manager.is_healthy = Mock(return_value=True)
         manager.process = None
         return manager
 
@@ -838,11 +1137,12 @@ class TestProxyClientEdgeCases:
         tools = proxy_client.get_available_tools()
         assert tools == {}
 
-    def test_get_available_tools_returns_copy(self, proxy_client):
-        """Test get_available_tools returns a copy, not the original."""
+    def test_get_available_tools_is_read_only(self, proxy_client):
+        """Test get_available_tools returns a read-only view, not the original."""
         proxy_client._available_tools = {"test": {"name": "test"}}
         tools = proxy_client.get_available_tools()
-        tools["new"] = {"name": "new"}
+        with pytest.raises(TypeError):
+            tools["new"] = {"name": "new"}
         assert "new" not in proxy_client._available_tools
 
     @pytest.mark.asyncio
@@ -2,6 +2,7 @@
 Tests for the Playwright MCP Proxy server
 """
 
+from collections.abc import Sequence
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -626,6 +627,7 @@ from playwright_proxy_mcp.server import (
     browser_snapshot,
     browser_execute_bulk,
     _fetch_fresh_snapshot,
+    _process_cached_snapshot,
     _process_snapshot_data,
 )
 
@@ -746,7 +748,29 @@ class TestProcessSnapshotData:
         snapshot = [{"role": "document", "children": [{"role": "main"}]}]
         result, error = _process_snapshot_data(snapshot, flatten=True, jmespath_query=None)
         assert error is None
-        assert isinstance(result, list)
+        assert isinstance(result, Sequence)
+        assert [node["role"] for node in result] == ["document", "main"]
+
+    def test_process_cached_snapshot_reuses_result_per_query(self):
+        from playwright_proxy_mcp.utils.navigation_cache import CacheEntry
+
+        snapshot = [{"role": "button", "name": "Click"}, {"role": "link", "name": "Home"}]
+        entry = CacheEntry(url="https://example.com", snapshot_json=snapshot)
+
+        with patch(
+            "playwright_proxy_mcp.server._process_snapshot_data", wraps=_process_snapshot_data
+        ) as mock_process:
+            first, _ = _process_cached_snapshot(entry, snapshot, False, "[?role=='button']")
+            second, _ = _process_cached_snapshot(entry, snapshot, False, "[?role=='button']")
+            other, _ = _process_cached_snapshot(entry, snapshot, False, "[?role=='link']")
+            _process_cached_snapshot(entry, snapshot, False, "[?")
+            _process_cached_snapshot(entry, snapshot, False, "[?")
+
+        assert second is first
+        assert other[0]["role"] == "link"
+        # Query errors are not memoized
+        assert mock_process.call_count == 4
+        assert (False, "[?") not in entry.processed
 
     def test_process_with_jmespath_query(self):
         snapshot = [{"role": "button", "name": "Click"}, {"role": "link", "name": "Home"}]
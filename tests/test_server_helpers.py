@@ -348,6 +348,16 @@ class TestExtractBlobIdFromResponse:
         blob_id = _extract_blob_id_from_response(result)
         assert blob_id == "blob://found-it.png"
 
+    def test_skips_bare_blob_scheme_before_real_url(self):
+        """Test a bare blob:// mention does not hide a later blob URL."""
+        result = {
+            "content": [
+                {"type": "text", "text": "Saved as blob:// (see [file](blob://later-1.png))"},
+            ]
+        }
+        blob_id = _extract_blob_id_from_response(result)
+        assert blob_id == "blob://later-1.png"
+
     def test_returns_first_blob_when_multiple(self):
         """Test that first blob is returned when multiple blobs present."""
         result = {
@@ -153,6 +153,19 @@ class TestPaginateResultData:
         assert total == 0
         assert has_more is False
 
+    def test_paginates_flattened_tree_lazily(self):
+        """Test flatten without a query returns a lazy view that paginates like a list."""
+        tree = [{"role": "list", "children": [{"role": "listitem", "ref": f"e{i}"} for i in range(10)]}]
+
+        result_data, error = _process_snapshot_data(tree, flatten=True, jmespath_query=None)
+        paginated, total, has_more = _paginate_result_data(result_data, offset=2, limit=3)
+
+        assert error is None
+        assert total == 11
+        assert has_more is True
+        assert [node["ref"] for node in paginated] == ["e1", "e2", "e3"]
+        assert paginated[0] == {"role": "listitem", "ref": "e1", "_depth": 1, "_parent_role": "list", "_index": 2}
+
 
 # =============================================================================
 # Navigation Tool Tests